@@ -4,6 +4,7 @@
 import asyncio
 import json
 import sys
+from itertools import chain
 from pathlib import Path
 
 from rich.console import Console
@@ -73,9 +74,9 @@ async def demo(base_url: str):
     extraction_results = await orchestrator._extract_with_llm(extracted_content)
     console.print(f" Processed [cyan]{len(extraction_results)}[/cyan] pages")
 
-    # Count total endpoints
-    total_endpoints = sum(len(r.endpoints) for r in extraction_results)
-    console.print(f" Extracted [cyan]{total_endpoints}[/cyan] endpoints")
+    # Collect all endpoints once for counting and coverage analysis
+    all_endpoints = list(chain.from_iterable(r.endpoints for r in extraction_results))
+    console.print(f" Extracted [cyan]{len(all_endpoints)}[/cyan] endpoints")
 
     # Stage 4: Build OpenAPI Spec
     console.print("\n[bold yellow]Stage 4:[/bold yellow] Building OpenAPI specification...")
@@ -102,10 +103,6 @@ async def demo(base_url: str):
             console.print(f"  - {error}")
 
     # Coverage analysis
-    all_endpoints = []
-    for result in extraction_results:
-        all_endpoints.extend(result.endpoints)
-
     analyzer = CoverageAnalyzer()
     coverage_report = analyzer.analyze(all_endpoints)
 
@@ -23,19 +23,80 @@ For Claude Desktop integration, add to claude_desktop_config.json:
 
 import asyncio
 import json
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from fastmcp import FastMCP
 
 from openapi_generator.generators.openapi_builder import OpenAPIBuilder
+from openapi_generator.models.schemas import ConfidenceLevel, ExtractionResult
 from openapi_generator.orchestrator import OpenAPIOrchestrator
+from openapi_generator.utils import json_fast, yaml_fast
+from openapi_generator.utils.query_filter import QueryFilter
 from openapi_generator.validators.coverage import CoverageAnalyzer
-from openapi_generator.validators.spec_validator import SpecValidator
+from openapi_generator.validators.spec_validator import SpecValidator, warm_up
 
 # Create MCP server
 mcp = FastMCP("OpenAPI Generator")
 
+# Stateless helpers shared by every tool call; the OpenAPI 3.0 meta-schema is
+# compiled once at startup instead of on the first request
+_VALIDATOR = SpecValidator()
+_ANALYZER = CoverageAnalyzer()
+warm_up()
+
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch", "head", "options"})
+
+# Output directories already created by this process
+_DIRS_ENSURED: set[Path] = set()
+
+
+def _parse_spec(spec_content: str) -> Dict[str, Any]:
+    """Parse an OpenAPI spec given as JSON or YAML text.
+
+    JSON is tried first only when the text looks like a JSON object, so YAML input
+    goes straight to the (libyaml-backed) YAML parser.
+    """
+    if spec_content[:64].lstrip().startswith("{"):
+        try:
+            return json_fast.loads(spec_content)
+        except json.JSONDecodeError:
+            pass
+    return yaml_fast.safe_load(spec_content)
+
+
+def _is_json(spec_content: str) -> bool:
+    """Check whether spec text is a valid JSON object."""
+    if not spec_content[:64].lstrip().startswith("{"):
+        return False
+    try:
+        json_fast.loads(spec_content)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
+def _iter_operations(paths: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield every operation object in a spec's paths, skipping non-method keys."""
+    for methods in paths.values():
+        for method, operation in methods.items():
+            # OpenAPI method keys are lowercase; only lowercase on a miss
+            if method in _HTTP_METHODS or method.lower() in _HTTP_METHODS:
+                yield operation
+
+
+def _has_example(operation: Dict[str, Any]) -> bool:
+    """Check whether an operation's request body or any response carries an example."""
+    bodies = [operation["requestBody"]] if "requestBody" in operation else []
+    bodies.extend(operation.get("responses", {}).values())
+
+    for body in bodies:
+        for media_type in body.get("content", {}).values():
+            if "example" in media_type or "examples" in media_type:
+                return True
+    return False
+
 
 @mcp.tool
 async def generate_openapi_spec(
@@ -43,6 +104,9 @@ async def generate_openapi_spec(
     output_format: str = "json",
     max_pages: Optional[int] = None,
     query_filter: Optional[str] = None,
+    validate: bool = True,
+    include_coverage: bool = True,
+    force_refresh: bool = False,
 ) -> Dict[str, Any]:
     """Generate an OpenAPI specification from API documentation.
 
@@ -54,22 +118,77 @@ async def generate_openapi_spec(
         output_format: Output format, either "json" or "yaml" (default: "json")
         max_pages: Maximum number of documentation pages to process (default: 50)
         query_filter: Natural language query to filter endpoints (e.g., "payment endpoints only")
+        validate: Validate the generated spec (default: True). Disable for faster results
+            on large specs.
+        include_coverage: Include coverage metrics and quality score (default: True)
+        force_refresh: Ignore cached discovery, pages and extraction results (default: False)
 
     Returns:
         A dictionary containing:
         - success: Whether the generation succeeded
         - spec: The generated OpenAPI specification (as dict)
         - endpoints_count: Number of endpoints extracted
-        - quality_score: Quality score (0-100)
-        - coverage_report: Coverage analysis
+        - is_valid / validation_errors: Validation outcome (only if validate is True)
+        - quality_score: Quality score (0-100, only if include_coverage is True)
+        - coverage_report: Coverage analysis (only if include_coverage is True)
         - error: Error message if failed
 
     Example:
         generate_openapi_spec("https://api.stripe.com")
     """
+    return await _generate_spec(
+        base_url, max_pages, query_filter, validate, include_coverage, force_refresh
+    )
+
+
+@mcp.tool
+async def quick_spec(
+    base_url: str,
+    max_pages: Optional[int] = None,
+    force_refresh: bool = False,
+) -> Dict[str, Any]:
+    """Generate an OpenAPI specification without validation or coverage analysis.
+
+    Use this when only the specification itself is needed; it skips the
+    validation and quality-analysis steps of generate_openapi_spec.
+
+    Args:
+        base_url: The base URL of the API to generate a spec for (e.g., "https://api.example.com")
+        max_pages: Maximum number of documentation pages to process (default: 50)
+        force_refresh: Ignore cached discovery, pages and extraction results (default: False)
+
+    Returns:
+        A dictionary containing:
+        - success: Whether the generation succeeded
+        - spec: The generated OpenAPI specification (as dict)
+        - endpoints_count: Number of endpoints extracted
+        - error: Error message if failed
+
+    Example:
+        quick_spec("https://catfact.ninja")
+    """
+    return await _generate_spec(
+        base_url,
+        max_pages,
+        None,
+        validate=False,
+        include_coverage=False,
+        force_refresh=force_refresh,
+    )
+
+
+async def _generate_spec(
+    base_url: str,
+    max_pages: Optional[int],
+    query_filter: Optional[str],
+    validate: bool,
+    include_coverage: bool,
+    force_refresh: bool,
+) -> Dict[str, Any]:
+    """Run the generation pipeline shared by generate_openapi_spec and quick_spec."""
     try:
         # Run orchestrator
-        orchestrator = OpenAPIOrchestrator(base_url)
+        orchestrator = OpenAPIOrchestrator(base_url, force_refresh=force_refresh)
 
         # Override max_pages if specified
         if max_pages:
@@ -85,63 +204,57 @@ async def generate_openapi_spec(
                 "endpoints_count": 0,
             }
 
-        # Build OpenAPI spec
-        builder = OpenAPIBuilder(base_url)
-        builder.add_extraction_results(results)
-        spec = builder.build()
-
-        # Convert spec to dict for validation and output
-        spec_dict = json.loads(builder.to_json(spec))
-
-        # Validate with dict
-        validator = SpecValidator()
-        is_valid, validation_errors = validator.validate(spec_dict)
-
         # Get coverage metrics from extracted endpoints
-        all_endpoints = []
-        for result in results:
-            all_endpoints.extend(result.endpoints)
+        all_endpoints = list(chain.from_iterable(result.endpoints for result in results))
 
-        # Apply query filter if provided
+        # Apply query filter before building so the spec is only built once
         if query_filter:
-            from openapi_generator.utils.query_filter import QueryFilter
             query_filter_obj = QueryFilter()
-            filtered_endpoints = query_filter_obj.apply_filter(all_endpoints, query_filter, threshold=0.3)
+            all_endpoints = query_filter_obj.apply_filter(
+                all_endpoints, query_filter, threshold=0.3
+            )
 
             # Rebuild results with filtered endpoints
-            from openapi_generator.models.schemas import ExtractionResult, ConfidenceLevel
-            results = [ExtractionResult(
-                endpoints=filtered_endpoints,
-                confidence=ConfidenceLevel.HIGH,
-            )]
+            results = [
+                ExtractionResult(
+                    endpoints=all_endpoints,
+                    confidence=ConfidenceLevel.HIGH,
+                )
+            ]
 
-            # Rebuild spec with filtered endpoints
-            builder = OpenAPIBuilder(base_url)
-            builder.add_extraction_results(results)
-            spec = builder.build()
-            spec_dict = json.loads(builder.to_json(spec))
-
-            all_endpoints = filtered_endpoints
+        # Build OpenAPI spec
+        builder = OpenAPIBuilder(base_url)
+        builder.add_extraction_results(results)
+        spec = builder.build()
 
-        analyzer = CoverageAnalyzer()
-        coverage = analyzer.analyze(all_endpoints)
+        # Convert spec to JSON-compatible dict for validation and output
+        spec_dict = spec.model_dump(mode="json", by_alias=True, exclude_none=True)
 
-        return {
+        response: Dict[str, Any] = {
             "success": True,
             "spec": spec_dict,
             "endpoints_count": len(spec_dict.get("paths", {})),
-            "quality_score": coverage.quality_score,
-            "is_valid": is_valid,
-            "validation_errors": validation_errors if not is_valid else [],
-            "coverage_report": {
+        }
+
+        # Validate with dict
+        if validate:
+            is_valid, validation_errors = _VALIDATOR.validate(spec_dict)
+            response["is_valid"] = is_valid
+            response["validation_errors"] = validation_errors if not is_valid else []
+
+        if include_coverage:
+            coverage = _ANALYZER.analyze(all_endpoints)
+            response["quality_score"] = coverage.quality_score
+            response["coverage_report"] = {
                 "total_endpoints": coverage.total_endpoints,
                 "endpoints_with_parameters": coverage.endpoints_with_parameters,
                 "endpoints_with_request_body": coverage.endpoints_with_request_body,
                 "endpoints_with_responses": coverage.endpoints_with_responses,
                 "endpoints_with_examples": coverage.endpoints_with_examples,
                 "confidence_distribution": coverage.confidence_distribution,
-            },
-        }
+            }
+
+        return response
 
     except Exception as e:
         return {
@@ -168,17 +281,11 @@ async def validate_openapi_spec(spec_content: str) -> Dict[str, Any]:
         validate_openapi_spec('{"openapi": "3.0.3", "info": {...}, "paths": {...}}')
     """
     try:
-        # Try to parse as JSON first
-        try:
-            spec_dict = json.loads(spec_content)
-        except json.JSONDecodeError:
-            # Try YAML
-            import yaml
-            spec_dict = yaml.safe_load(spec_content)
+        # Parse spec (JSON or YAML)
+        spec_dict = _parse_spec(spec_content)
 
         # Validate
-        validator = SpecValidator()
-        is_valid, errors = validator.validate(spec_dict)
+        is_valid, errors = _VALIDATOR.validate(spec_dict)
 
         return {
             "is_valid": is_valid,
@@ -215,60 +322,26 @@ async def analyze_spec_coverage(spec_content: str) -> Dict[str, Any]:
         analyze_spec_coverage('{"openapi": "3.0.3", ...}')
     """
     try:
-        # Parse spec
-        try:
-            spec_dict = json.loads(spec_content)
-        except json.JSONDecodeError:
-            import yaml
-            spec_dict = yaml.safe_load(spec_content)
+        # Parse spec (JSON or YAML)
+        spec_dict = _parse_spec(spec_content)
 
-        # Manually analyze the spec structure
-        paths = spec_dict.get("paths", {})
+        # Manually analyze the spec structure in a single pass over the operations
         total_endpoints = 0
         endpoints_with_params = 0
         endpoints_with_request_body = 0
         endpoints_with_responses = 0
         endpoints_with_examples = 0
 
-        for path, methods in paths.items():
-            for method, operation in methods.items():
-                if method.lower() in ["get", "post", "put", "delete", "patch", "head", "options"]:
-                    total_endpoints += 1
-
-                    # Check for parameters
-                    if operation.get("parameters"):
-                        endpoints_with_params += 1
-
-                    # Check for request body
-                    if operation.get("requestBody"):
-                        endpoints_with_request_body += 1
-
-                    # Check for responses
-                    if operation.get("responses"):
-                        endpoints_with_responses += 1
-
-                    # Check for examples
-                    has_example = False
-                    # Check request body examples
-                    if "requestBody" in operation:
-                        content = operation["requestBody"].get("content", {})
-                        for media_type in content.values():
-                            if "example" in media_type or "examples" in media_type:
-                                has_example = True
-                                break
-                    # Check response examples
-                    if not has_example and "responses" in operation:
-                        for response in operation["responses"].values():
-                            content = response.get("content", {})
-                            for media_type in content.values():
-                                if "example" in media_type or "examples" in media_type:
-                                    has_example = True
-                                    break
-                            if has_example:
-                                break
-
-                    if has_example:
-                        endpoints_with_examples += 1
+        for operation in _iter_operations(spec_dict.get("paths", {})):
+            total_endpoints += 1
+            if operation.get("parameters"):
+                endpoints_with_params += 1
+            if operation.get("requestBody"):
+                endpoints_with_request_body += 1
+            if operation.get("responses"):
+                endpoints_with_responses += 1
+            if _has_example(operation):
+                endpoints_with_examples += 1
 
         # Generate recommendations
         recommendations = []
@@ -333,32 +406,34 @@ async def save_openapi_spec(
         save_openapi_spec(spec, "/path/to/output.json", "json")
     """
     try:
-        # Parse spec
-        try:
-            spec_dict = json.loads(spec_content)
-        except json.JSONDecodeError:
-            import yaml
-            spec_dict = yaml.safe_load(spec_content)
+        # Ensure output directory exists (once per directory per process)
+        output_file = Path(output_path).absolute()
+        if output_file.parent not in _DIRS_ENSURED:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            _DIRS_ENSURED.add(output_file.parent)
 
-        # Ensure output directory exists
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
+        # Serialize up front so the size is known without a stat() call
         if format.lower() == "yaml":
-            import yaml
-            with open(output_file, "w") as f:
-                yaml.dump(spec_dict, f, default_flow_style=False, sort_keys=False)
+            payload = yaml_fast.dump(_parse_spec(spec_content)).encode("utf-8")
+        elif _is_json(spec_content):
+            # Already JSON: write it as given instead of re-serializing
+            payload = spec_content.encode("utf-8")
         else:
-            with open(output_file, "w") as f:
-                json.dump(spec_dict, f, indent=2)
+            payload = json_fast.dumps(_parse_spec(spec_content), indent=True)
 
-        file_size = output_file.stat().st_size
+        try:
+            output_file.write_bytes(payload)
+        except FileNotFoundError:
+            # Directory removed since it was cached as created: recreate it and retry once
+            _DIRS_ENSURED.discard(output_file.parent)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            _DIRS_ENSURED.add(output_file.parent)
+            output_file.write_bytes(payload)
 
         return {
             "success": True,
-            "path": str(output_file.absolute()),
-            "size_bytes": file_size,
+            "path": str(output_file),
+            "size_bytes": len(payload),
             "format": format,
         }
 
@@ -428,6 +503,7 @@ def get_status() -> Dict[str, Any]:
         "version": "0.1.0",
         "capabilities": [
             "generate_openapi_spec",
+            "quick_spec",
             "validate_openapi_spec",
             "analyze_spec_coverage",
             "save_openapi_spec",
@@ -3,18 +3,17 @@
 import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from openapi_generator.config import get_settings
-from openapi_generator.generators.openapi_builder import OpenAPIBuilder
-from openapi_generator.orchestrator import OpenAPIOrchestrator
-from openapi_generator.validators.coverage import CoverageAnalyzer
-from openapi_generator.validators.spec_validator import SpecValidator
+# Heavy modules (pydantic models, anthropic, playwright, validators) are imported
+# inside the functions that use them so --help starts instantly
+if TYPE_CHECKING:
+    from openapi_generator.models.schemas import CoverageReport, Endpoint
 
 console = Console()
 
@@ -75,9 +74,17 @@ def main(
         )
     )
 
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:  # optional, not available on Windows
+        loop_factory = None
+
     # Run async pipeline
     try:
-        asyncio.run(run_pipeline(base_url, output, format, validate, filter, doc_url))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_pipeline(base_url, output, format, validate, filter, doc_url))
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled by user[/yellow]")
         sys.exit(1)
@@ -104,6 +111,14 @@ async def run_pipeline(
         filter: Natural language query to filter endpoints
         doc_urls: Manual documentation URLs to use (bypasses discovery)
     """
+    from itertools import chain
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from openapi_generator.config import get_settings
+    from openapi_generator.generators.openapi_builder import OpenAPIBuilder
+    from openapi_generator.orchestrator import OpenAPIOrchestrator
+
     settings = get_settings()
 
     # Normalize base URL
@@ -136,7 +151,7 @@ async def run_pipeline(
             )
         else:
             task = progress.add_task("Discovering documentation pages...", total=None)
-            doc_urls = await orchestrator.discovery.discover()
+            doc_urls = await orchestrator.discover()
             progress.update(task, completed=True)
             console.print(f"Found {len(doc_urls)} documentation pages")
 
@@ -144,21 +159,18 @@ async def run_pipeline(
             console.print("[red]No documentation pages found! Exiting.[/red]")
             return
 
-        # Content extraction
-        task = progress.add_task("Extracting content from pages...", total=None)
-        extracted_content = await orchestrator._extract_content_from_urls(doc_urls)
+        # Content and LLM extraction, pipelined: LLM calls start as soon as the
+        # first page is fetched instead of after the whole site
+        task = progress.add_task("Extracting content and API info...", total=None)
+        extraction_results = await orchestrator._extract_pipelined(doc_urls)
         progress.update(task, completed=True)
-        console.print(f"Extracted content from {len(extracted_content)} pages")
+        console.print(f"Extracted content from {len(orchestrator.extracted_content)} pages")
 
-        if not extracted_content:
+        if not orchestrator.extracted_content:
             console.print("[red]No content extracted! Exiting.[/red]")
             return
 
-        # LLM extraction
-        task = progress.add_task("Extracting API info with LLM...", total=None)
-        extraction_results = await orchestrator._extract_with_llm(extracted_content)
-        progress.update(task, completed=True)
-        console.print(f"Processed {len(extraction_results)} pages with LLM")
+        console.print(f"Found API information on {len(extraction_results)} pages")
 
         # Apply query filter if provided
         if filter:
@@ -167,9 +179,9 @@ async def run_pipeline(
             query_filter = QueryFilter()
 
             # Collect all endpoints
-            all_endpoints_before = []
-            for result in extraction_results:
-                all_endpoints_before.extend(result.endpoints)
+            all_endpoints_before = list(
+                chain.from_iterable(result.endpoints for result in extraction_results)
+            )
 
             # Filter endpoints
             filtered_endpoints = query_filter.apply_filter(
@@ -199,24 +211,39 @@ async def run_pipeline(
         progress.update(task, completed=True)
         console.print("OpenAPI specification built")
 
-    # Convert spec to dict for validation and output
+    # Convert spec to dict once; validation and output share it, coverage and the
+    # summary read the endpoints and model directly
     spec_dict = spec.model_dump(by_alias=True, exclude_none=True)
 
-    # Generate coverage report
-    console.print("\n[bold]Coverage Report:[/bold]")
-    all_endpoints = []
-    for result in extraction_results:
-        all_endpoints.extend(result.endpoints)
+    if filter:
+        # The filter already produced the flat endpoint list
+        all_endpoints = extraction_results[0].endpoints
+    else:
+        all_endpoints = list(chain.from_iterable(result.endpoints for result in extraction_results))
+
+    # Determine output path
+    if not output:
+        domain = (urlsplit(base_url).hostname or "output").replace(".", "_")
+        output = str(settings.output_dir / f"{domain}.openapi.{format}")
+
+    output_path = Path(output)
+
+    # Coverage, validation and the file write are independent; run them off the
+    # event loop together and report the results afterwards
+    coverage_report, validation, output_size = await asyncio.gather(
+        asyncio.to_thread(_coverage, all_endpoints),
+        asyncio.to_thread(_validate, spec_dict, validate),
+        asyncio.to_thread(_write_output, spec_dict, output_path, format),
+    )
 
-    coverage_analyzer = CoverageAnalyzer()
-    coverage_report = coverage_analyzer.analyze(all_endpoints)
+    # Coverage report
+    console.print("\n[bold]Coverage Report:[/bold]")
     display_coverage_report(coverage_report)
 
     # Validation
-    if validate:
+    if validation is not None:
         console.print("\n[bold]Validation:[/bold]")
-        validator = SpecValidator()
-        is_valid, errors, recommendations = validator.validate_with_recommendations(spec_dict)
+        is_valid, errors, recommendations = validation
 
         if is_valid:
             console.print("[green]Specification is valid![/green]")
@@ -232,90 +259,126 @@ async def run_pipeline(
 
     # Output
     console.print("\n[bold]Output:[/bold]")
-
-    # Determine output path
-    if not output:
-        domain = base_url.replace("https://", "").replace("http://", "").split("/")[0]
-        domain = domain.replace(".", "_")
-        output = str(settings.output_dir / f"{domain}.openapi.{format}")
-
-    output_path = Path(output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write output
-    if format == "json":
-        output_text = builder.to_json(spec)
-    else:
-        output_text = builder.to_yaml(spec)
-
-    output_path.write_text(output_text)
-
     console.print(f"Specification written to: [cyan]{output_path}[/cyan]")
     console.print(f"  Format: {format.upper()}")
-    console.print(f"  Size: {len(output_text):,} bytes")
+    console.print(f"  Size: {output_size:,} bytes")
 
     # Summary
     console.print(
         Panel.fit(
             f"[bold green]Success![/bold green]\n"
-            f"Generated OpenAPI spec with {len(spec_dict.get('paths', {}))} paths",
+            f"Generated OpenAPI spec with {len(spec.paths)} paths",
             border_style="green",
         )
     )
 
 
+def _coverage(endpoints: list["Endpoint"]) -> "CoverageReport":
+    """Analyze endpoint coverage.
+
+    Args:
+        endpoints: All extracted endpoints
+
+    Returns:
+        Coverage report
+    """
+    from openapi_generator.validators.coverage import CoverageAnalyzer
+
+    return CoverageAnalyzer().analyze(endpoints)
+
+
+def _validate(spec_dict: dict[str, Any], enabled: bool) -> tuple[bool, list[str], list[str]] | None:
+    """Validate the spec and collect recommendations.
+
+    Args:
+        spec_dict: OpenAPI specification as a dict
+        enabled: Whether validation was requested
+
+    Returns:
+        Tuple of (is_valid, errors, recommendations), or None if disabled
+    """
+    if not enabled:
+        return None
+
+    from openapi_generator.validators.spec_validator import SpecValidator
+
+    return SpecValidator().validate_with_recommendations(spec_dict)
+
+
+def _write_output(spec_dict: dict[str, Any], output_path: Path, format: str) -> int:
+    """Write the spec to disk straight from the dict.
+
+    Args:
+        spec_dict: OpenAPI specification as a dict
+        output_path: Destination file
+        format: Output format (json or yaml)
+
+    Returns:
+        Size of the written file in bytes
+    """
+    from openapi_generator.utils import json_fast, yaml_fast
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if format == "json":
+        payload = json_fast.dumps(spec_dict, indent=True)
+    else:
+        payload = yaml_fast.dump(spec_dict).encode("utf-8")
+
+    # The byte length of the payload is the file size; no stat() needed
+    output_path.write_bytes(payload)
+    return len(payload)
+
+
 def display_coverage_report(report) -> None:
     """Display coverage report in a formatted table.
 
     Args:
         report: Coverage report
     """
+    from rich.console import Group
+    from rich.table import Table
+
+    total_endpoints = report.total_endpoints
+    # Counts are zero when there are no endpoints, so max(..., 1) avoids a branch
+    denominator = max(total_endpoints, 1)
+
+    def pct(count: int) -> str:
+        return f"{count / denominator * 100:.1f}%"
+
+    rows = [
+        ("Total Endpoints", str(total_endpoints), "100%"),
+        (
+            "With Parameters",
+            str(report.endpoints_with_parameters),
+            pct(report.endpoints_with_parameters),
+        ),
+        (
+            "With Request Body",
+            str(report.endpoints_with_request_body),
+            pct(report.endpoints_with_request_body),
+        ),
+        (
+            "With Responses",
+            str(report.endpoints_with_responses),
+            pct(report.endpoints_with_responses),
+        ),
+        (
+            "With Examples",
+            str(report.endpoints_with_examples),
+            pct(report.endpoints_with_examples),
+        ),
+    ]
+
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Metric", style="white")
     table.add_column("Value", justify="right", style="cyan")
     table.add_column("Percentage", justify="right", style="yellow")
 
-    # Add rows
-    table.add_row(
-        "Total Endpoints",
-        str(report.total_endpoints),
-        "100%",
-    )
-    table.add_row(
-        "With Parameters",
-        str(report.endpoints_with_parameters),
-        f"{report.parameter_coverage:.1f}%",
-    )
-    body_pct = (
-        (report.endpoints_with_request_body / report.total_endpoints * 100)
-        if report.total_endpoints > 0
-        else 0
-    )
-    table.add_row(
-        "With Request Body",
-        str(report.endpoints_with_request_body),
-        f"{body_pct:.1f}%",
-    )
-    table.add_row(
-        "With Responses",
-        str(report.endpoints_with_responses),
-        f"{report.response_coverage:.1f}%",
-    )
-    examples_pct = (
-        (report.endpoints_with_examples / report.total_endpoints * 100)
-        if report.total_endpoints > 0
-        else 0
-    )
-    table.add_row(
-        "With Examples",
-        str(report.endpoints_with_examples),
-        f"{examples_pct:.1f}%",
-    )
-
-    console.print(table)
+    for row in rows:
+        table.add_row(*row)
 
     # Confidence distribution
-    console.print("\n[bold]Confidence Distribution:[/bold]")
     conf_table = Table(show_header=False)
     conf_table.add_column("Level", style="white")
     conf_table.add_column("Count", justify="right")
@@ -324,13 +387,18 @@ def display_coverage_report(report) -> None:
         color = "green" if level == "high" else "yellow" if level == "medium" else "red"
         conf_table.add_row(f"[{color}]{level.title()}[/{color}]", str(count))
 
-    console.print(conf_table)
-
     # Quality score
     score = report.quality_score
     score_color = "green" if score >= 70 else "yellow" if score >= 50 else "red"
+
+    # Render everything in one print call
     console.print(
-        f"\n[bold]Overall Quality Score:[/bold] [{score_color}]{score:.1f}%[/{score_color}]"
+        Group(
+            table,
+            "\n[bold]Confidence Distribution:[/bold]",
+            conf_table,
+            f"\n[bold]Overall Quality Score:[/bold] [{score_color}]{score:.1f}%[/{score_color}]",
+        )
     )
 
 
@@ -1,6 +1,7 @@
 """Configuration management for OpenAPI generator."""
 
 import logging
+from functools import cache
 from pathlib import Path
 
 from pydantic import Field
@@ -44,6 +45,26 @@ class Settings(BaseSettings):
         description="Maximum concurrent LLM API calls",
         validation_alias="MAX_CONCURRENT_LLM_CALLS",
     )
+    llm_batch_size: int = Field(
+        default=4,
+        description="Maximum documentation pages packed into a single LLM request",
+        validation_alias="LLM_BATCH_SIZE",
+    )
+    use_batch_api: bool = Field(
+        default=False,
+        description="Extract pages through the Message Batches API (cheaper, higher latency)",
+        validation_alias="USE_BATCH_API",
+    )
+    llm_requests_per_minute: int = Field(
+        default=50,
+        description="Maximum LLM API requests per minute",
+        validation_alias="LLM_REQUESTS_PER_MINUTE",
+    )
+    llm_max_retries: int = Field(
+        default=3,
+        description="Retries with exponential backoff for failed LLM API calls",
+        validation_alias="LLM_MAX_RETRIES",
+    )
     rate_limit_delay: float = Field(
         default=1.0,
         description="Delay between requests (seconds)",
@@ -61,6 +82,21 @@ class Settings(BaseSettings):
         description="Maximum crawl depth",
         validation_alias="MAX_DEPTH",
     )
+    max_page_bytes: int = Field(
+        default=2_000_000,
+        description="Skip documentation pages larger than this many bytes",
+        validation_alias="MAX_PAGE_BYTES",
+    )
+    render_concurrency: int = Field(
+        default=4,
+        description="Maximum pages rendered at once in the headless browser",
+        validation_alias="RENDER_CONCURRENCY",
+    )
+    render_block_assets: bool = Field(
+        default=True,
+        description="Skip images, fonts, media and stylesheets when rendering pages",
+        validation_alias="RENDER_BLOCK_ASSETS",
+    )
 
     # Logging
     log_level: str = Field(
@@ -133,20 +169,15 @@ class Settings(BaseSettings):
 
 
 # Global settings instance
-_settings: Settings | None = None
-
-
+@cache
 def get_settings() -> Settings:
-    """Get or create settings instance (singleton pattern)."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()  # type: ignore
-        _settings.setup_logging()
-        _settings.ensure_output_dir()
-    return _settings
+    """Get or create settings instance (singleton, cached after the first call)."""
+    settings = Settings()  # type: ignore
+    settings.setup_logging()
+    settings.ensure_output_dir()
+    return settings
 
 
 def reset_settings() -> None:
     """Reset settings instance (useful for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
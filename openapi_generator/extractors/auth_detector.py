@@ -1,86 +1,178 @@
 """Enhanced authentication detection using patterns and heuristics."""
 
 import re
+from collections import OrderedDict
 
 from openapi_generator.models.schemas import SecurityScheme
+from openapi_generator.utils.hashing import digest
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _compile_any(patterns: list[str]) -> re.Pattern[str]:
+    """Combine alternative patterns into a single case-insensitive regex.
+
+    Args:
+        patterns: List of regex patterns
+
+    Returns:
+        Compiled pattern matching if any of the patterns match
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+# Common auth patterns
+_AUTH_PATTERN_SOURCES = {
+    "api_key_header": [
+        r"api[_\s-]?key.{0,50}header",
+        r"x-api-key",
+        r"authorization.{0,30}api[_\s-]?key",
+        r"include.{0,30}api[_\s-]?key.{0,30}header",
+    ],
+    "api_key_query": [
+        r"api[_\s-]?key.{0,50}query.{0,20}parameter",
+        r"api[_\s-]?key.{0,50}url",
+        r"\?api[_\s-]?key=",
+    ],
+    "bearer_token": [
+        r"bearer\s+token",
+        r"authorization:\s*bearer",
+        r"bearer.{0,30}authentication",
+        r"jwt.{0,30}bearer",
+    ],
+    "basic_auth": [
+        r"basic\s+auth",
+        r"authorization:\s*basic",
+        r"username.{0,30}password.{0,30}base64",
+    ],
+    "oauth2": [
+        r"oauth\s*2\.0",
+        r"oauth2",
+        r"authorization.{0,30}code.{0,30}flow",
+        r"client.{0,30}credentials.{0,30}flow",
+        r"access.{0,30}token.{0,30}endpoint",
+    ],
+}
+
+# OAuth2 flow detection patterns
+_OAUTH2_FLOW_PATTERN_SOURCES = {
+    "authorization_code": [
+        r"authorization.{0,20}code",
+        r"three.{0,10}legged",
+        r"redirect.{0,20}uri",
+    ],
+    "client_credentials": [
+        r"client.{0,20}credentials",
+        r"machine.{0,20}to.{0,20}machine",
+        r"two.{0,10}legged",
+    ],
+    "password": [
+        r"resource.{0,20}owner.{0,20}password",
+        r"password.{0,20}flow",
+        r"username.{0,20}password.{0,20}grant",
+    ],
+    "implicit": [
+        r"implicit.{0,20}flow",
+        r"implicit.{0,20}grant",
+    ],
+}
+
+# Literals at least one of which every pattern in a group must contain; a page
+# without any of a group's anchors cannot match that group
+_GROUP_ANCHORS = {
+    "api_key_header": frozenset({"api"}),
+    "api_key_query": frozenset({"api"}),
+    "bearer_token": frozenset({"bearer"}),
+    "basic_auth": frozenset({"basic", "base64"}),
+    "oauth2": frozenset({"oauth", "authoriz", "credential", "token"}),
+}
+
+_ANCHOR_PATTERN = re.compile(
+    "|".join(sorted(set().union(*_GROUP_ANCHORS.values()), key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+_JWT_PATTERN = re.compile(r"jwt|json web token", re.IGNORECASE)
+
+# Common patterns for header names, in priority order; each has one capture group
+_HEADER_NAME_SOURCES = (
+    r"(?:header|include).{0,30}['\"`]([xX]-[aA][pP][iI]-[kK]ey)['\"`]",
+    r"(?:header|include).{0,30}['\"`]([aA]uthorization)['\"`]",
+    r"(?:header|include).{0,30}['\"`]([xX]-[aA][uU][tT][hH]-[tT]oken)['\"`]",
+    r"['\"`]([xX]-[^'\"` ]+)['\"`].{0,30}header",
+)
+_HEADER_NAME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in _HEADER_NAME_SOURCES]
+
+# All header patterns in one alternation; match.lastindex tells which one matched
+_HEADER_NAME_RE = re.compile("|".join(_HEADER_NAME_SOURCES), re.IGNORECASE)
+
+
 class AuthDetector:
     """Detects authentication schemes from documentation text using patterns."""
 
-    # Common auth patterns
+    # Combined regex per auth scheme
     AUTH_PATTERNS = {
-        "api_key_header": [
-            r"api[_\s-]?key.{0,50}header",
-            r"x-api-key",
-            r"authorization.{0,30}api[_\s-]?key",
-            r"include.{0,30}api[_\s-]?key.{0,30}header",
-        ],
-        "api_key_query": [
-            r"api[_\s-]?key.{0,50}query.{0,20}parameter",
-            r"api[_\s-]?key.{0,50}url",
-            r"\?api[_\s-]?key=",
-        ],
-        "bearer_token": [
-            r"bearer\s+token",
-            r"authorization:\s*bearer",
-            r"bearer.{0,30}authentication",
-            r"jwt.{0,30}bearer",
-        ],
-        "basic_auth": [
-            r"basic\s+auth",
-            r"authorization:\s*basic",
-            r"username.{0,30}password.{0,30}base64",
-        ],
-        "oauth2": [
-            r"oauth\s*2\.0",
-            r"oauth2",
-            r"authorization.{0,30}code.{0,30}flow",
-            r"client.{0,30}credentials.{0,30}flow",
-            r"access.{0,30}token.{0,30}endpoint",
-        ],
+        name: _compile_any(patterns) for name, patterns in _AUTH_PATTERN_SOURCES.items()
     }
 
-    # OAuth2 flow detection patterns
+    # Combined regex per OAuth2 flow
     OAUTH2_FLOW_PATTERNS = {
-        "authorization_code": [
-            r"authorization.{0,20}code",
-            r"three.{0,10}legged",
-            r"redirect.{0,20}uri",
-        ],
-        "client_credentials": [
-            r"client.{0,20}credentials",
-            r"machine.{0,20}to.{0,20}machine",
-            r"two.{0,10}legged",
-        ],
-        "password": [
-            r"resource.{0,20}owner.{0,20}password",
-            r"password.{0,20}flow",
-            r"username.{0,20}password.{0,20}grant",
-        ],
-        "implicit": [
-            r"implicit.{0,20}flow",
-            r"implicit.{0,20}grant",
-        ],
+        name: _compile_any(patterns) for name, patterns in _OAUTH2_FLOW_PATTERN_SOURCES.items()
     }
 
+    def __init__(self, cache_size: int = 128):
+        """Initialize auth detector.
+
+        Args:
+            cache_size: Number of documents whose results are kept
+        """
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, list[SecurityScheme]] = OrderedDict()
+
     def detect_auth_schemes(self, text: str) -> list[SecurityScheme]:
         """Detect authentication schemes from documentation text.
 
+        Results are cached by content hash, so re-scanning the same document is free.
+
+        Args:
+            text: Documentation text to analyze
+
+        Returns:
+            List of detected SecurityScheme objects
+        """
+        key = digest(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return list(cached)
+
+        detected_schemes = self._scan(text)
+
+        self._cache[key] = detected_schemes
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return list(detected_schemes)
+
+    def _scan(self, text: str) -> list[SecurityScheme]:
+        """Run pattern detection over documentation text.
+
         Args:
             text: Documentation text to analyze
 
         Returns:
             List of detected SecurityScheme objects
         """
-        text_lower = text.lower()
         detected_schemes = []
 
+        # One cheap pass over the text decides which pattern groups can match at all
+        anchors = {match.group().lower() for match in _ANCHOR_PATTERN.finditer(text)}
+        if not anchors:
+            return detected_schemes
+
         # Check for API key in header
-        if self._matches_any_pattern(text_lower, self.AUTH_PATTERNS["api_key_header"]):
+        if self._matches_group(text, "api_key_header", anchors):
             logger.info("Detected API Key (header) authentication")
 
             # Try to extract header name
@@ -96,7 +188,7 @@ class AuthDetector:
             )
 
         # Check for API key in query
-        if self._matches_any_pattern(text_lower, self.AUTH_PATTERNS["api_key_query"]):
+        if self._matches_group(text, "api_key_query", anchors):
             logger.info("Detected API Key (query) authentication")
 
             detected_schemes.append(
@@ -109,11 +201,11 @@ class AuthDetector:
             )
 
         # Check for Bearer token
-        if self._matches_any_pattern(text_lower, self.AUTH_PATTERNS["bearer_token"]):
+        if self._matches_group(text, "bearer_token", anchors):
             logger.info("Detected Bearer token authentication")
 
             # Check if it's JWT
-            is_jwt = "jwt" in text_lower or "json web token" in text_lower
+            is_jwt = _JWT_PATTERN.search(text) is not None
             bearer_format = "JWT" if is_jwt else None
 
             detected_schemes.append(
@@ -126,7 +218,7 @@ class AuthDetector:
             )
 
         # Check for Basic auth
-        if self._matches_any_pattern(text_lower, self.AUTH_PATTERNS["basic_auth"]):
+        if self._matches_group(text, "basic_auth", anchors):
             logger.info("Detected Basic authentication")
 
             detected_schemes.append(
@@ -138,11 +230,11 @@ class AuthDetector:
             )
 
         # Check for OAuth2
-        if self._matches_any_pattern(text_lower, self.AUTH_PATTERNS["oauth2"]):
+        if self._matches_group(text, "oauth2", anchors):
             logger.info("Detected OAuth2 authentication")
 
             # Try to detect OAuth2 flows
-            flows = self._detect_oauth2_flows(text_lower)
+            flows = self._detect_oauth2_flows(text)
             flow_desc = f"OAuth 2.0 ({', '.join(flows)})" if flows else "OAuth 2.0"
 
             detected_schemes.append(
@@ -154,20 +246,32 @@ class AuthDetector:
 
         return detected_schemes
 
-    def _matches_any_pattern(self, text: str, patterns: list[str]) -> bool:
-        """Check if text matches any of the given patterns.
+    def _matches_group(self, text: str, group: str, anchors: set[str]) -> bool:
+        """Check if text matches an auth pattern group, skipping groups with no anchor hit.
+
+        Args:
+            text: Text to check
+            group: Key into AUTH_PATTERNS
+            anchors: Anchor literals found in the text
+
+        Returns:
+            True if the group's pattern matches
+        """
+        if anchors.isdisjoint(_GROUP_ANCHORS[group]):
+            return False
+        return self._matches_any_pattern(text, self.AUTH_PATTERNS[group])
+
+    def _matches_any_pattern(self, text: str, pattern: re.Pattern[str]) -> bool:
+        """Check if text matches a combined pattern.
 
         Args:
             text: Text to check
-            patterns: List of regex patterns
+            pattern: Compiled pattern from AUTH_PATTERNS or OAUTH2_FLOW_PATTERNS
 
         Returns:
-            True if any pattern matches
+            True if the pattern matches
         """
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return pattern.search(text) is not None
 
     def _extract_header_name(self, text: str) -> str | None:
         """Try to extract API key header name from text.
@@ -178,20 +282,18 @@ class AuthDetector:
         Returns:
             Header name or None
         """
-        # Common patterns for header names
-        patterns = [
-            r"(?:header|include).{0,30}['\"`]([xX]-[aA][pP][iI]-[kK]ey)['\"`]",
-            r"(?:header|include).{0,30}['\"`]([aA]uthorization)['\"`]",
-            r"(?:header|include).{0,30}['\"`]([xX]-[aA][uU][tT][hH]-[tT]oken)['\"`]",
-            r"['\"`]([xX]-[^'\"` ]+)['\"`].{0,30}header",
-        ]
+        match = _HEADER_NAME_RE.search(text)
+        if match is None:
+            return None
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        # The combined search finds the leftmost match; a higher-priority pattern
+        # may still match further on, so only those are re-checked
+        for pattern in _HEADER_NAME_PATTERNS[: match.lastindex - 1]:
+            priority_match = pattern.search(text)
+            if priority_match:
+                return priority_match.group(1)
 
-        return None
+        return match.group(match.lastindex)
 
     def _detect_oauth2_flows(self, text: str) -> list[str]:
         """Detect OAuth2 flows mentioned in text.
@@ -204,8 +306,8 @@ class AuthDetector:
         """
         flows = []
 
-        for flow_type, patterns in self.OAUTH2_FLOW_PATTERNS.items():
-            if self._matches_any_pattern(text, patterns):
+        for flow_type, pattern in self.OAUTH2_FLOW_PATTERNS.items():
+            if self._matches_any_pattern(text, pattern):
                 flows.append(flow_type)
 
         return flows
@@ -227,42 +329,35 @@ class AuthDetector:
 
         # Merge schemes (prefer LLM schemes, add pattern-detected ones if not present)
         enhanced_schemes = list(llm_schemes)
+        seen = {self._scheme_key(scheme) for scheme in enhanced_schemes}
 
         for pattern_scheme in pattern_schemes:
             # Check if similar scheme already exists
-            if not self._scheme_exists(pattern_scheme, enhanced_schemes):
+            key = self._scheme_key(pattern_scheme)
+            if key not in seen:
                 logger.info(f"Adding pattern-detected auth: {pattern_scheme.type}")
                 enhanced_schemes.append(pattern_scheme)
+                seen.add(key)
 
         return enhanced_schemes
 
-    def _scheme_exists(self, scheme: SecurityScheme, schemes: list[SecurityScheme]) -> bool:
-        """Check if a similar scheme already exists in the list.
+    @staticmethod
+    def _scheme_key(scheme: SecurityScheme) -> tuple[str, str | None]:
+        """Get the key under which similar schemes are considered duplicates.
 
         Args:
-            scheme: Scheme to check
-            schemes: List of existing schemes
+            scheme: Scheme to key
 
         Returns:
-            True if similar scheme exists
+            Tuple of scheme type and its distinguishing field
         """
-        for existing in schemes:
-            # Same type
-            if existing.type != scheme.type:
-                continue
-
-            # For apiKey, check location
-            if scheme.type == "apiKey":
-                if existing.location == scheme.location:
-                    return True
-
-            # For http, check scheme
-            elif scheme.type == "http":
-                if existing.scheme == scheme.scheme:
-                    return True
-
-            # For oauth2 or openIdConnect
-            elif scheme.type in ["oauth2", "openIdConnect"]:
-                return True
-
-        return False
+        # For apiKey, compare location
+        if scheme.type == "apiKey":
+            return (scheme.type, scheme.location)
+
+        # For http, compare scheme
+        if scheme.type == "http":
+            return (scheme.type, scheme.scheme)
+
+        # For oauth2 or openIdConnect, one of each is enough
+        return (scheme.type, None)
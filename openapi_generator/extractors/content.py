@@ -1,15 +1,45 @@
 """Content extraction from documentation pages."""
 
+import asyncio
 import re
 
 import httpx
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, Tag
 
 from openapi_generator.config import get_settings
+from openapi_generator.utils.cache import get_cache_manager
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Size of the HTML prefix parsed first when checking a page for static content
+SPA_SAMPLE_CHARS = 65536
+
+# Content types that can hold documentation (a missing content type is allowed)
+_DOCUMENT_CONTENT_TYPE_RE = re.compile(
+    r"$|text/|application/(?:xhtml\+xml|xml|json|[\w.-]+\+json|(?:x-)?yaml)"
+)
+
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+_SPACES_RE = re.compile(r" +")
+_CONTENT_CLASS_RE = re.compile(r"content|documentation|docs")
+
+# Common SPA indicators, as one case-insensitive alternation
+_SPA_INDICATOR_RE = re.compile(
+    "|".join(
+        [
+            r"<div\s+id=['\"]root['\"]",
+            r"<div\s+id=['\"]app['\"]",
+            r"React",
+            r"Vue",
+            r"Angular",
+            r"ng-app",
+            r"data-reactroot",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 
 class DocumentContent:
     """Represents extracted content from a documentation page."""
@@ -27,15 +57,22 @@ class DocumentContent:
         self.title = title
         self.text = text
         self.code_samples = code_samples
+        # Content is not modified after extraction, so size it once for batching
+        self._char_count = len(text) + sum(map(len, code_samples))
 
     def __repr__(self) -> str:
         """String representation."""
         return f"DocumentContent(url={self.url}, title={self.title}, chars={len(self.text)})"
 
+    @property
+    def char_count(self) -> int:
+        """Characters of text and code samples."""
+        return self._char_count
+
     @property
     def token_estimate(self) -> int:
         """Estimate token count (rough approximation: 1 token ≈ 4 chars)."""
-        return (len(self.text) + sum(len(code) for code in self.code_samples)) // 4
+        return self._char_count // 4
 
 
 class ContentExtractor:
@@ -47,50 +84,203 @@ class ContentExtractor:
     # Tags that typically contain code
     CODE_TAGS = ["code", "pre"]
 
-    def __init__(self):
-        """Initialize content extractor."""
+    _REMOVE_TAG_SET = frozenset(REMOVE_TAGS)
+
+    def __init__(self, use_cache: bool = True):
+        """Initialize content extractor.
+
+        Args:
+            use_cache: Serve and revalidate pages from the HTTP cache (responses are
+                cached either way)
+        """
         self.settings = get_settings()
+        self.cache_manager = get_cache_manager()
+        self.use_cache = use_cache
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "ContentExtractor":
+        """Open a shared HTTP client used by extract_from_url within the block."""
+        self._client = self.create_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def create_client(self, max_connections: int | None = None) -> httpx.AsyncClient:
+        """Create an HTTP client configured for documentation fetching.
+
+        Sharing one client across fetches reuses pooled TCP/TLS connections
+        to the documentation host.
+
+        Args:
+            max_connections: Connection pool size (defaults to max_concurrent_requests)
 
-    async def extract_from_url(self, url: str) -> DocumentContent | None:
+        Returns:
+            Configured async HTTP client (caller is responsible for closing it)
+        """
+        max_connections = max_connections or self.settings.max_concurrent_requests
+        return httpx.AsyncClient(
+            timeout=self.settings.request_timeout,
+            headers={"User-Agent": self.settings.user_agent},
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+        )
+
+    async def extract_from_url(
+        self, url: str, client: httpx.AsyncClient | None = None
+    ) -> DocumentContent | None:
         """Extract content from a URL.
 
         Args:
             url: URL to extract from
+            client: Shared HTTP client to use (defaults to the client opened with
+                ``async with``, or a temporary one)
 
         Returns:
             DocumentContent if successful, None otherwise
         """
         logger.info(f"Extracting content from {url}")
 
+        client = client or self._client
         try:
-            async with httpx.AsyncClient(
-                timeout=self.settings.request_timeout,
-                headers={"User-Agent": self.settings.user_agent},
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Check Content-Type header
-                content_type = response.headers.get("content-type", "").lower()
-
-                if "application/json" in content_type:
-                    # Don't use BeautifulSoup for JSON responses
-                    logger.info(f"Detected JSON content-type for {url}, preserving raw JSON")
-                    return DocumentContent(
-                        url=url,
-                        title="JSON API Spec",
-                        text=response.text,  # Keep raw JSON
-                        code_samples=[response.text],  # Also add to code samples
-                    )
-                else:
-                    # Use BeautifulSoup for HTML
-                    return self.extract_from_html(url, response.text)
+            if client is not None:
+                return await self._fetch_and_extract(client, url)
+
+            async with self.create_client(max_connections=1) as client:
+                return await self._fetch_and_extract(client, url)
 
         except Exception as e:
             logger.error(f"Failed to extract from {url}: {e}")
             return None
 
+    async def _fetch_and_extract(
+        self, client: httpx.AsyncClient, url: str
+    ) -> DocumentContent | None:
+        """Fetch a URL and extract its content.
+
+        Args:
+            client: HTTP client
+            url: URL to fetch
+
+        Returns:
+            Extracted document content, or None if the page was skipped
+        """
+        fetched = await self._fetch(client, url)
+        if fetched is None:
+            return None
+
+        body, content_type = fetched
+
+        if "application/json" in content_type:
+            # Don't use BeautifulSoup for JSON responses
+            logger.info(f"Detected JSON content-type for {url}, preserving raw JSON")
+            return DocumentContent(
+                url=url,
+                title="JSON API Spec",
+                text=body,  # Keep raw JSON
+                code_samples=[body],  # Also add to code samples
+            )
+        else:
+            # Use BeautifulSoup for HTML
+            return self.extract_from_html(url, body)
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> tuple[str, str] | None:
+        """Fetch a URL through the HTTP cache.
+
+        Fresh cache entries are served without a request. Stale entries with an
+        ETag or Last-Modified validator are revalidated with a conditional GET and
+        reused on 304 Not Modified.
+
+        Args:
+            client: HTTP client
+            url: URL to fetch
+
+        Returns:
+            Tuple of (response body, lowercased content type), or None if the page
+            was skipped
+        """
+        metadata = self.cache_manager.get_http_metadata(url) if self.use_cache else None
+
+        if metadata is not None:
+            cached_body = self.cache_manager.get_http_cache(url)
+            if cached_body is not None:
+                logger.debug(f"Serving {url} from HTTP cache")
+                return cached_body, metadata.get("content-type", "")
+
+        conditional_headers = {}
+        if metadata is not None:
+            if metadata.get("etag"):
+                conditional_headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last-modified"):
+                conditional_headers["If-Modified-Since"] = metadata["last-modified"]
+
+        # Stream so oversized or non-document responses are dropped before download
+        async with client.stream("GET", url, headers=conditional_headers) as response:
+            if response.status_code != 304 or metadata is None:
+                return await self._read_response(url, response)
+
+            cached_body = self.cache_manager.get_http_cache(url, allow_stale=True)
+            if cached_body is not None:
+                logger.info(f"{url} not modified, using cached copy")
+                self.cache_manager.touch_http_cache(url)
+                return cached_body, metadata.get("content-type", "")
+
+        # Cache body vanished; fetch unconditionally
+        async with client.stream("GET", url) as response:
+            return await self._read_response(url, response)
+
+    async def _read_response(self, url: str, response: httpx.Response) -> tuple[str, str] | None:
+        """Read a streamed response body and store it in the HTTP cache.
+
+        Args:
+            url: Requested URL
+            response: Streamed response whose body has not been read yet
+
+        Returns:
+            Tuple of (response body, lowercased content type), or None if the page
+            is not a document or exceeds max_page_bytes
+        """
+        response.raise_for_status()
+
+        # Check Content-Type header
+        content_type = response.headers.get("content-type", "").lower()
+        if not _DOCUMENT_CONTENT_TYPE_RE.match(content_type):
+            logger.info(f"Skipping {url}: not a documentation content type ({content_type})")
+            return None
+
+        max_bytes = self.settings.max_page_bytes
+        if int(response.headers.get("content-length") or 0) > max_bytes:
+            logger.info(f"Skipping {url}: larger than {max_bytes} bytes")
+            return None
+
+        # Content-Length may be absent (chunked encoding), so also enforce while reading
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                logger.info(f"Skipping {url}: larger than {max_bytes} bytes")
+                return None
+            chunks.append(chunk)
+
+        body = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+
+        validators = {
+            name: response.headers[name]
+            for name in ("etag", "last-modified")
+            if name in response.headers
+        }
+        self.cache_manager.set_http_cache(
+            url, body, headers={"content-type": content_type, **validators}
+        )
+
+        return body, content_type
+
     def extract_from_html(self, url: str, html: str) -> DocumentContent:
         """Extract content from HTML.
 
@@ -101,19 +291,13 @@ class ContentExtractor:
         Returns:
             Extracted document content
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         # Extract title
         title = self._extract_title(soup)
 
-        # Extract code samples first (before we clean the HTML)
-        code_samples = self._extract_code_samples(soup)
-
-        # Clean up the HTML
-        self._remove_unwanted_elements(soup)
-
-        # Extract text content
-        text = self._extract_text(soup)
+        # Code samples and main text in a single walk of the tree
+        text, code_samples = self._extract_text_and_code(soup)
 
         # Clean up text
         text = self._clean_text(text)
@@ -142,61 +326,52 @@ class ContentExtractor:
 
         return "Untitled"
 
-    def _extract_code_samples(self, soup: BeautifulSoup) -> list[str]:
-        """Extract code samples from the page.
+    def _extract_text_and_code(self, soup: BeautifulSoup) -> tuple[str, list[str]]:
+        """Extract main text content and code samples with one traversal.
+
+        Code samples are collected from the whole page before cleanup. Unwanted
+        elements are then removed and text is taken from the main content area
+        (main, article, a content div, or body, in that order of preference).
 
         Args:
-            soup: BeautifulSoup object
+            soup: BeautifulSoup object (unwanted elements are removed in-place)
 
         Returns:
-            List of code samples
+            Tuple of (extracted text, code samples)
         """
-        code_samples = []
-
-        for tag_name in self.CODE_TAGS:
-            for tag in soup.find_all(tag_name):
+        # Code samples grouped by tag in CODE_TAGS order
+        samples_by_tag: dict[str, list[str]] = {tag_name: [] for tag_name in self.CODE_TAGS}
+        unwanted: list[Tag] = []
+        # Main content candidates in order of preference
+        candidates: dict[str, list[Tag]] = {"main": [], "article": [], "div": [], "body": []}
+
+        for tag in soup.find_all(True):
+            name = tag.name
+            if name in samples_by_tag:
                 code = tag.get_text().strip()
-                if code and len(code) > 10:  # Skip very short snippets
-                    code_samples.append(code)
-
-        return code_samples
-
-    def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
-        """Remove unwanted elements from soup (in-place).
-
-        Args:
-            soup: BeautifulSoup object to clean
-        """
-        for tag_name in self.REMOVE_TAGS:
-            for tag in soup.find_all(tag_name):
+                if len(code) > 10:  # Skip very short snippets
+                    samples_by_tag[name].append(code)
+
+            if name in self._REMOVE_TAG_SET:
+                unwanted.append(tag)
+            elif name in candidates and (
+                name != "div" or _CONTENT_CLASS_RE.search(" ".join(tag.get("class") or ()))
+            ):
+                candidates[name].append(tag)
+
+        # Nested matches (e.g. a script inside nav) go with their ancestor; comments
+        # need no removal because get_text() already skips them
+        for tag in unwanted:
+            if not tag.decomposed:
                 tag.decompose()
 
-        # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, NavigableString)):
-            if "<!--" in str(comment):
-                comment.extract()
-
-    def _extract_text(self, soup: BeautifulSoup) -> str:
-        """Extract text content from cleaned soup.
-
-        Args:
-            soup: BeautifulSoup object
-
-        Returns:
-            Extracted text
-        """
-        # Focus on main content areas if they exist
-        main_content = (
-            soup.find("main")
-            or soup.find("article")
-            or soup.find("div", class_=re.compile(r"content|documentation|docs"))
-            or soup.find("body")
+        main_content = next(
+            (tag for group in candidates.values() for tag in group if not tag.decomposed),
+            soup,
         )
+        text = main_content.get_text(separator="\n", strip=True)
 
-        if main_content:
-            return main_content.get_text(separator="\n", strip=True)
-
-        return soup.get_text(separator="\n", strip=True)
+        return text, [code for samples in samples_by_tag.values() for code in samples]
 
     def _clean_text(self, text: str) -> str:
         """Clean extracted text.
@@ -208,12 +383,11 @@ class ContentExtractor:
             Cleaned text
         """
         # Remove excessive whitespace
-        text = re.sub(r"\n\s*\n", "\n\n", text)  # Multiple newlines to double newline
-        text = re.sub(r" +", " ", text)  # Multiple spaces to single space
+        text = _BLANK_LINES_RE.sub("\n\n", text)  # Multiple newlines to double newline
+        text = _SPACES_RE.sub(" ", text)  # Multiple spaces to single space
 
-        # Remove very short lines (likely navigation artifacts)
-        lines = text.split("\n")
-        lines = [line for line in lines if len(line.strip()) > 3 or line.strip() == ""]
+        # Remove very short lines (likely navigation artifacts), stripping each once
+        lines = (line for line in text.split("\n") if not 0 < len(line.strip()) <= 3)
 
         return "\n".join(lines).strip()
 
@@ -228,11 +402,17 @@ class ContentExtractor:
         """
         logger.info(f"Extracting content from {len(urls)} URLs")
 
-        results = {}
-        for url in urls:
-            content = await self.extract_from_url(url)
-            if content:
-                results[url] = content
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests)
+
+        async with self.create_client() as client:
+
+            async def extract_one(url: str) -> DocumentContent | None:
+                async with semaphore:
+                    return await self.extract_from_url(url, client)
+
+            contents = await asyncio.gather(*(extract_one(url) for url in urls))
+
+        results = {url: content for url, content in zip(urls, contents) if content}
 
         logger.info(f"Successfully extracted {len(results)}/{len(urls)} pages")
         return results
@@ -247,22 +427,24 @@ class ContentExtractor:
             True if SPA detected
         """
         # Look for common SPA indicators
-        spa_indicators = [
-            r"<div\s+id=['\"]root['\"]",
-            r"<div\s+id=['\"]app['\"]",
-            r"React",
-            r"Vue",
-            r"Angular",
-            r"ng-app",
-            r"data-reactroot",
-        ]
+        if not _SPA_INDICATOR_RE.search(html):
+            return False
+
+        # Check if there's minimal content. Text only grows with more HTML, so if
+        # the prefix already has enough the full page does too.
+        prefix = html[:SPA_SAMPLE_CHARS]
+        if len(prefix) < len(html) and self._static_text_length(prefix) >= 500:
+            return False
+
+        return self._static_text_length(html) < 500  # Very little static content
 
-        for indicator in spa_indicators:
-            if re.search(indicator, html, re.IGNORECASE):
-                # Check if there's minimal content
-                soup = BeautifulSoup(html, "html.parser")
-                text = soup.get_text().strip()
-                if len(text) < 500:  # Very little static content
-                    return True
+    def _static_text_length(self, html: str) -> int:
+        """Measure the visible text of an HTML document.
 
-        return False
+        Args:
+            html: HTML content
+
+        Returns:
+            Length of the stripped page text
+        """
+        return len(BeautifulSoup(html, "lxml").get_text().strip())
@@ -1,18 +1,53 @@
 """Documentation discovery system for finding API documentation pages."""
 
 import asyncio
+import io
 import re
-from urllib.parse import urljoin, urlparse
+from collections import deque
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 
 import httpx
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from openapi_generator.config import get_settings
 from openapi_generator.utils.logger import get_logger
+from openapi_generator.utils.rate_limiter import AsyncRateLimiter
 from openapi_generator.utils.robots import RobotsChecker
 
 logger = get_logger(__name__)
 
+# Only the start of a page is scanned by the documentation heuristics
+CLASSIFY_SAMPLE_CHARS = 65536
+
+# Content types worth downloading when probing for documentation (an empty
+# content type is given the benefit of the doubt)
+_DOC_CONTENT_TYPE_RE = re.compile(r"^$|html|json|yaml|text/plain")
+
+# Keywords whose presence suggests a page documents an API
+_API_KEYWORD_RE = re.compile(
+    "endpoint|api|request|response|authentication|get|post|put|delete|parameter|header|body|json"
+)
+
+# HTTP methods as written in request examples, e.g. "GET /users"
+_HTTP_METHOD_RE = re.compile(r"(GET|POST|PUT|DELETE|PATCH) ")
+
+# URL patterns that indicate API documentation with high confidence
+_STRONG_URL_RE = re.compile(
+    "|".join(
+        [
+            r"/api.*docs?",
+            r"/api.*reference",
+            r"/rest.*api",
+            r"/graphql",
+        ]
+    )
+)
+
+# Child sitemaps followed from a sitemap index
+MAX_CHILD_SITEMAPS = 50
+
 
 class DocumentationDiscovery:
     """Discovers API documentation pages from a base URL."""
@@ -85,6 +120,16 @@ class DocumentationDiscovery:
         r"/webhook",
     ]
 
+    # API_DOC_PATTERNS compiled into one alternation. Path patterns share their
+    # leading "/" so the engine only tries them where the URL has a slash, which
+    # roughly halves the cost on URLs that match nothing
+    _API_DOC_RE = re.compile(
+        "/(?:"
+        + "|".join(pattern[1:] for pattern in API_DOC_PATTERNS if pattern.startswith("/"))
+        + ")|"
+        + "|".join(pattern for pattern in API_DOC_PATTERNS if not pattern.startswith("/"))
+    )
+
     def __init__(self, base_url: str):
         """Initialize discovery system.
 
@@ -95,6 +140,8 @@ class DocumentationDiscovery:
         self.settings = get_settings()
         self.visited_urls: set[str] = set()
         self.doc_urls: set[str] = set()
+        self._seen_sitemaps: set[str] = set()
+        self._host_limiters: dict[str, AsyncRateLimiter | None] = {}
         self.robots_checker = RobotsChecker(base_url)
 
     async def discover(self) -> list[str]:
@@ -145,7 +192,7 @@ class DocumentationDiscovery:
 
         for result in results:
             if isinstance(result, str):  # Successfully found a doc URL
-                self.doc_urls.add(result)
+                self.doc_urls.add(self._normalize_url(result))
 
     async def _check_url(self, client: httpx.AsyncClient, url: str) -> str | None:
         """Check if a URL exists and looks like documentation.
@@ -158,8 +205,18 @@ class DocumentationDiscovery:
             URL if valid, None otherwise
         """
         try:
-            response = await client.get(url)
-            if response.status_code == 200:
+            # Probe with HEAD first so missing paths cost no body transfer
+            head = await client.head(url)
+            if head.status_code not in (405, 501):  # HEAD unsupported: probe with GET
+                content_type = head.headers.get("content-type", "").lower()
+                if head.status_code != 200 or not _DOC_CONTENT_TYPE_RE.search(content_type):
+                    return None
+
+            # Only the sample classified by _is_api_documentation is needed
+            response = await client.get(
+                url, headers={"Range": f"bytes=0-{CLASSIFY_SAMPLE_CHARS - 1}"}
+            )
+            if response.status_code in (200, 206):
                 # Check if it looks like API documentation
                 if self._is_api_documentation(url, response.text):
                     logger.debug(f"Found documentation at: {url}")
@@ -171,6 +228,9 @@ class DocumentationDiscovery:
     def _is_api_documentation(self, url: str, html: str) -> bool:
         """Heuristic to determine if a page is API documentation.
 
+        Content checks only look at the first CLASSIFY_SAMPLE_CHARS characters of
+        the page, which is plenty to classify it.
+
         Args:
             url: Page URL
             html: Page HTML content
@@ -179,39 +239,21 @@ class DocumentationDiscovery:
             True if page appears to be API documentation
         """
         url_lower = url.lower()
+        html = html[:CLASSIFY_SAMPLE_CHARS]
         html_lower = html.lower()
 
         # Strategy 1: Strong URL match (high confidence)
-        strong_url_patterns = [
-            r"/api.*docs?",
-            r"/api.*reference",
-            r"/rest.*api",
-            r"/graphql",
-        ]
-        if any(re.search(pattern, url_lower) for pattern in strong_url_patterns):
+        if _STRONG_URL_RE.search(url_lower):
             logger.debug(f"Strong URL match for {url}")
             return True
 
         # Strategy 2: Moderate URL match + minimal content check
-        if any(re.search(pattern, url_lower) for pattern in self.API_DOC_PATTERNS):
-            # CHANGED: Lower threshold from 3 to 2, expanded keyword list
-            api_keywords = [
-                "endpoint",
-                "api",
-                "request",
-                "response",
-                "authentication",
-                "get",
-                "post",
-                "put",
-                "delete",
-                "parameter",
-                "header",
-                "body",
-                "json",
-            ]
-            keyword_count = sum(1 for keyword in api_keywords if keyword in html_lower)
+        # Distinct API keywords on the page, collected in a single pass
+        found_keywords = {match.group() for match in _API_KEYWORD_RE.finditer(html_lower)}
+        keyword_count = len(found_keywords)
 
+        if self._API_DOC_RE.search(url_lower):
+            # CHANGED: Lower threshold from 3 to 2, expanded keyword list
             if keyword_count >= 2:  # CHANGED: Was 3
                 logger.debug(f"URL pattern + keyword match for {url} (keywords: {keyword_count})")
                 return True
@@ -228,29 +270,12 @@ class DocumentationDiscovery:
             return True
 
         # Check for high density of API keywords
-        api_keywords_extended = [
-            "endpoint",
-            "api",
-            "request",
-            "response",
-            "authentication",
-            "get",
-            "post",
-            "put",
-            "delete",
-            "parameter",
-            "header",
-            "body",
-            "json",
-        ]
-        api_keyword_density = sum(1 for kw in api_keywords_extended if kw in html_lower)
-        if api_keyword_density >= 5:  # 5+ keywords = probably API docs
-            logger.debug(f"High API keyword density in {url} ({api_keyword_density} keywords)")
+        if keyword_count >= 5:  # 5+ keywords = probably API docs
+            logger.debug(f"High API keyword density in {url} ({keyword_count} keywords)")
             return True
 
-        # Check for code examples with HTTP methods
-        http_methods = ["GET ", "POST ", "PUT ", "DELETE ", "PATCH "]
-        method_count = sum(1 for method in http_methods if method in html_lower)
+        # Check for code examples with HTTP methods (upper case, as in request examples)
+        method_count = len({match.group(1) for match in _HTTP_METHOD_RE.finditer(html)})
         if method_count >= 2:
             logger.debug(f"HTTP method examples detected in {url} ({method_count} methods)")
             return True
@@ -266,39 +291,104 @@ class DocumentationDiscovery:
         """
         logger.info("Checking for sitemap.xml...")
 
-        sitemap_urls = [
-            urljoin(self.base_url, "/sitemap.xml"),
-            urljoin(self.base_url, "/sitemap_index.xml"),
-        ]
-
-        for sitemap_url in sitemap_urls:
-            try:
-                response = await client.get(sitemap_url)
-                if response.status_code == 200:
-                    logger.info(f"Found sitemap at {sitemap_url}")
-                    await self._extract_urls_from_sitemap(response.text)
-                    return
-            except Exception as e:
-                logger.debug(f"No sitemap at {sitemap_url}: {e}")
-
-    async def _extract_urls_from_sitemap(self, sitemap_xml: str) -> None:
-        """Extract documentation URLs from sitemap XML.
+        # Sitemaps declared in robots.txt plus the conventional locations
+        sitemap_urls = list(
+            dict.fromkeys(
+                [
+                    *self.robots_checker.get_sitemaps(),
+                    urljoin(self.base_url, "/sitemap.xml"),
+                    urljoin(self.base_url, "/sitemap_index.xml"),
+                ]
+            )
+        )
+
+        # Request all candidates at once so a slow one doesn't delay the others
+        tasks = [asyncio.create_task(client.get(url)) for url in sitemap_urls]
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                try:
+                    response = await next_response
+                    if response.status_code == 200:
+                        logger.info(f"Found sitemap at {response.url}")
+                        self._seen_sitemaps.add(str(response.url))
+                        await self._extract_urls_from_sitemap(client, response.content)
+                        return
+                except Exception as e:
+                    logger.debug(f"Sitemap candidate failed: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Retrieve every outcome so failed candidates don't log unretrieved exceptions
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _extract_urls_from_sitemap(
+        self, client: httpx.AsyncClient, sitemap_xml: bytes
+    ) -> None:
+        """Extract documentation URLs from sitemap XML, following sitemap indexes.
 
         Args:
+            client: HTTP client used to fetch child sitemaps
             sitemap_xml: Sitemap XML content
         """
-        soup = BeautifulSoup(sitemap_xml, "xml")
-        urls = soup.find_all("loc")
+        page_urls, child_sitemaps = await asyncio.to_thread(self._parse_sitemap_xml, sitemap_xml)
 
-        for url_tag in urls:
-            url = url_tag.text.strip()
+        for url in page_urls:
             if self._is_likely_api_doc_url(url):
-                self.doc_urls.add(url)
+                self.doc_urls.add(self._normalize_url(url))
                 logger.debug(f"Found doc URL in sitemap: {url}")
 
-    def _is_likely_api_doc_url(self, url: str) -> bool:
+        # A sitemap index lists child sitemaps; children are never followed again
+        for child_url in child_sitemaps[:MAX_CHILD_SITEMAPS]:
+            if child_url in self._seen_sitemaps:
+                continue
+            self._seen_sitemaps.add(child_url)
+            try:
+                response = await client.get(child_url)
+                response.raise_for_status()
+                logger.debug(f"Following child sitemap {child_url}")
+                await self._extract_urls_from_sitemap(client, response.content)
+            except Exception as e:
+                logger.debug(f"Failed to read child sitemap {child_url}: {e}")
+
+    @staticmethod
+    def _parse_sitemap_xml(sitemap_xml: bytes) -> tuple[list[str], list[str]]:
+        """Stream-parse sitemap XML without building the whole tree.
+
+        Args:
+            sitemap_xml: Sitemap or sitemap index XML content
+
+        Returns:
+            Tuple of (page URLs from <url> entries, child sitemap URLs from <sitemap> entries)
+        """
+        page_urls: list[str] = []
+        child_sitemaps: list[str] = []
+
+        # "{*}" matches the sitemaps.org namespace as well as unqualified sitemaps
+        for _, elem in etree.iterparse(
+            io.BytesIO(sitemap_xml),
+            tag=("{*}url", "{*}sitemap"),
+            resolve_entities=False,
+            no_network=True,
+        ):
+            loc = (elem.findtext("{*}loc") or "").strip()
+            if loc:
+                target = child_sitemaps if etree.QName(elem).localname == "sitemap" else page_urls
+                target.append(loc)
+
+            # Drop processed entries so memory stays flat on large sitemaps
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        return page_urls, child_sitemaps
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _is_likely_api_doc_url(url: str) -> bool:
         """Check if a URL is likely API documentation.
 
+        Memoized because navigation links repeat on nearly every crawled page.
+
         Args:
             url: URL to check
 
@@ -306,7 +396,7 @@ class DocumentationDiscovery:
             True if URL matches API documentation patterns
         """
         url_lower = url.lower()
-        return any(re.search(pattern, url_lower) for pattern in self.API_DOC_PATTERNS)
+        return DocumentationDiscovery._API_DOC_RE.search(url_lower) is not None
 
     async def _crawl_from_base(self, client: httpx.AsyncClient) -> None:
         """Crawl from base URL to find documentation.
@@ -316,25 +406,34 @@ class DocumentationDiscovery:
         """
         logger.info("Starting breadth-first crawl from base URL...")
 
-        queue = [self.base_url]
+        # Links that look like documentation are crawled before the rest
+        priority_queue = deque([self.base_url])
+        queue: deque[str] = deque()
+        # More queued URLs than the page budget could never be visited
+        max_queued = self.settings.max_pages_per_site
         depth = 0
 
-        while queue and depth < self.settings.max_depth:
-            current_batch = queue[: self.settings.max_concurrent_requests]
-            queue = queue[self.settings.max_concurrent_requests :]
+        while (priority_queue or queue) and depth < self.settings.max_depth:
+            batch_size = min(
+                self.settings.max_concurrent_requests, len(priority_queue) + len(queue)
+            )
+            current_batch = [(priority_queue or queue).popleft() for _ in range(batch_size)]
 
             tasks = [self._crawl_page(client, url) for url in current_batch]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             for result in results:
-                if isinstance(result, list):
-                    queue.extend(result)
+                if isinstance(result, tuple):
+                    doc_links, other_links = result
+                    for target, links in ((priority_queue, doc_links), (queue, other_links)):
+                        room = max(0, max_queued - len(priority_queue) - len(queue))
+                        target.extend(links[:room])
 
             depth += 1
 
         logger.info(f"Crawl complete at depth {depth}")
 
-    async def _crawl_page(self, client: httpx.AsyncClient, url: str) -> list[str]:
+    async def _crawl_page(self, client: httpx.AsyncClient, url: str) -> tuple[list[str], list[str]]:
         """Crawl a single page and extract links.
 
         Args:
@@ -342,28 +441,36 @@ class DocumentationDiscovery:
             url: URL to crawl
 
         Returns:
-            List of new URLs to visit
+            Tuple of (links that look like documentation, other links) to visit,
+            at most 10 in total
         """
+        # Links often differ only by fragment or trailing slash; fetch each page once
+        url = self._normalize_url(url)
         if url in self.visited_urls:
-            return []
+            return [], []
 
         self.visited_urls.add(url)
 
         if len(self.visited_urls) > self.settings.max_pages_per_site:
-            return []
+            return [], []
 
         try:
+            limiter = self._host_limiter(url)
+            if limiter is not None:
+                await limiter.acquire()
+
             response = await client.get(url)
             if response.status_code != 200:
-                return []
+                return [], []
 
             # Check if this is a documentation page
             if self._is_api_documentation(url, response.text):
                 self.doc_urls.add(url)
 
             # Extract links to continue crawling
-            soup = BeautifulSoup(response.text, "html.parser")
-            new_urls = []
+            soup = BeautifulSoup(response.text, "lxml")
+            doc_links: list[str] = []
+            other_links: list[str] = []
 
             for link in soup.find_all("a", href=True):
                 href = link["href"]
@@ -373,18 +480,62 @@ class DocumentationDiscovery:
                 if self._is_same_domain(absolute_url):
                     # Prioritize links that look like documentation
                     if self._is_likely_api_doc_url(absolute_url):
-                        new_urls.insert(0, absolute_url)  # Add to front of queue
+                        doc_links.append(absolute_url)
+                        if len(doc_links) == 10:
+                            break
                     else:
-                        new_urls.append(absolute_url)
-
-            # Rate limiting
-            await asyncio.sleep(self.settings.rate_limit_delay)
+                        other_links.append(absolute_url)
 
-            return new_urls[:10]  # Limit breadth
+            # Limit breadth
+            return doc_links, other_links[: 10 - len(doc_links)]
 
         except Exception as e:
             logger.debug(f"Failed to crawl {url}: {e}")
-            return []
+            return [], []
+
+    def _host_limiter(self, url: str) -> AsyncRateLimiter | None:
+        """Get the crawl rate limiter for a URL's host.
+
+        A robots.txt crawl delay allows one request per delay. Otherwise up to
+        max_concurrent_requests requests are allowed per rate_limit_delay seconds.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Rate limiter for the host, or None if crawling is unthrottled
+        """
+        host = urlsplit(url).netloc
+        if host not in self._host_limiters:
+            crawl_delay = self.robots_checker.get_crawl_delay(self.settings.user_agent)
+            if crawl_delay:
+                limiter = AsyncRateLimiter(1, crawl_delay)
+            elif self.settings.rate_limit_delay > 0:
+                limiter = AsyncRateLimiter(
+                    self.settings.max_concurrent_requests, self.settings.rate_limit_delay
+                )
+            else:
+                limiter = None
+            self._host_limiters[host] = limiter
+
+        return self._host_limiters[host]
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL so equivalent spellings compare equal.
+
+        Lowercases the scheme and host, drops the fragment and strips a trailing
+        slash from non-root paths.
+
+        Args:
+            url: URL to normalize
+
+        Returns:
+            Normalized URL
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
 
     def _is_same_domain(self, url: str) -> bool:
         """Check if URL is on the same domain as base URL.
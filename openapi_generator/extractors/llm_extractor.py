@@ -1,6 +1,8 @@
 """LLM-powered extraction of API information from documentation."""
 
+import asyncio
 import json
+import re
 
 import anthropic
 
@@ -12,29 +14,49 @@ from openapi_generator.models.schemas import (
     DataType,
     Endpoint,
     ExtractionResult,
-    HTTPMethod,
     Parameter,
-    ParameterLocation,
     RequestBody,
     Response,
     Schema,
     SecurityScheme,
 )
+from openapi_generator.utils import json_fast
 from openapi_generator.utils.cache import get_cache_manager
 from openapi_generator.utils.logger import get_logger
+from openapi_generator.utils.rate_limiter import AsyncRateLimiter
 
 logger = get_logger(__name__)
 
+# Operation keys of an OpenAPI path item
+_OPENAPI_METHODS = frozenset({"get", "post", "put", "delete", "patch", "head", "options"})
+
+# Token budget for one page's documentation text
+MAX_DOC_TOKENS = 150_000
+# Shorter pages cannot reach MAX_DOC_TOKENS, even for dense code, so are never counted
+TOKEN_COUNT_MIN_CHARS = 200_000
+# Character cut used when token counting is unavailable (about 4 chars per token)
+MAX_DOC_CHARS = 600_000
+# Stop bisecting for the truncation point once it is known to this many characters
+TRUNCATION_PRECISION_CHARS = 10_000
+
+# Message Batches status polling backs off from the first to the max interval (seconds)
+BATCH_POLL_INITIAL_INTERVAL = 5.0
+BATCH_POLL_MAX_INTERVAL = 60.0
+
+# Output budget per request: a floor plus an allowance per endpoint-looking line, capped
+MIN_OUTPUT_TOKENS = 1024
+MAX_OUTPUT_TOKENS = 16384
+OUTPUT_TOKENS_PER_ENDPOINT = 256
+# "GET /users" style lines and "/users": keys of embedded path objects
+_ENDPOINT_HINT_RE = re.compile(
+    r"\b(?:GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+/|\"/[^\"\s]*\"\s*:"
+)
+
 
 class LLMExtractor:
     """Extracts API information using Claude with structured outputs."""
 
-    EXTRACTION_PROMPT = """You are an API documentation analyzer. Your task is to extract ALL API \
-endpoints from the documentation.
-
-TASK: For EVERY endpoint you find, call the record_endpoint tool.
-
-What is an endpoint?
+    EXTRACTION_GUIDE = """What is an endpoint?
 - A URL path that accepts HTTP requests (GET, POST, PUT, DELETE, PATCH, etc.)
 - Examples: /users, /api/v1/data, /facts, /breeds/{id}
 
@@ -55,27 +77,69 @@ For each endpoint, extract:
 - summary: Brief description of what it does (required)
 - parameters: Query params, path params, headers (optional)
 - responses: Status codes and descriptions (optional)
-- confidence: "high" if you're certain, "medium" if some info missing, "low" if unclear
+- confidence: "high" if you're certain, "medium" if some info missing, "low" if unclear"""
 
-Documentation:
+    # Static instructions go in the system prompt so they can be served from the
+    # prompt cache; only the documentation in the user message changes per request
+    EXTRACTION_SYSTEM_PROMPT = (
+        """You are an API documentation analyzer. Your task is to extract ALL API \
+endpoints from the documentation.
+
+TASK: For EVERY endpoint you find, call the record_endpoint tool.
+
+""" + EXTRACTION_GUIDE
+    )
+
+    EXTRACTION_PROMPT = """Documentation:
 {documentation}
 
 Now extract ALL endpoints by calling record_endpoint for each one."""
 
-    def __init__(self):
-        """Initialize LLM extractor."""
+    MULTI_PAGE_SYSTEM_PROMPT = (
+        """You are an API documentation analyzer. Your task is to extract ALL API \
+endpoints from several documentation pages. Each page starts with a ---PAGE k--- marker.
+
+TASK: For EVERY endpoint you find, call the record_endpoint tool. Every tool call MUST set \
+"page" to the number k of the ---PAGE k--- block the information was found in.
+
+""" + EXTRACTION_GUIDE
+    )
+
+    MULTI_PAGE_PROMPT = """Documentation ({page_count} pages):
+{documentation}
+
+Now extract ALL endpoints from ALL {page_count} pages by calling record_endpoint for each one."""
+
+    def __init__(self, use_cache: bool = True):
+        """Initialize LLM extractor.
+
+        Args:
+            use_cache: Reuse cached LLM results (results are cached either way)
+        """
         self.settings = get_settings()
-        self.client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
+        self.use_cache = use_cache
+        self.client = anthropic.AsyncAnthropic(
+            api_key=self.settings.anthropic_api_key,
+            timeout=self.settings.llm_timeout,
+            max_retries=self.settings.llm_max_retries,
+        )
+        self.rate_limiter = AsyncRateLimiter(self.settings.llm_requests_per_minute, 60.0)
         self.cache_manager = get_cache_manager()
-        self.auth_detector = AuthDetector()
+        self.auth_detector = AuthDetector(cache_size=self.settings.max_pages_per_site)
+        self._tools = self._create_extraction_tools()
+        self._multi_page_tools = self._create_extraction_tools(multi_page=True)
 
-    def _create_extraction_tools(self) -> list[dict]:
+    def _create_extraction_tools(self, multi_page: bool = False) -> list[dict]:
         """Create tools definition for structured output.
 
+        Args:
+            multi_page: Add a required "page" field so tool calls can be routed back
+                to the ``---PAGE k---`` block they came from
+
         Returns:
             List of tool definitions
         """
-        return [
+        tools = [
             {
                 "name": "record_endpoint",
                 "description": "Record an API endpoint with its complete information",
@@ -210,6 +274,17 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
             },
         ]
 
+        if multi_page:
+            for tool in tools:
+                input_schema = tool["input_schema"]
+                input_schema["properties"]["page"] = {
+                    "type": "integer",
+                    "description": "Number k of the ---PAGE k--- block this was found in",
+                }
+                input_schema["required"] = [*input_schema.get("required", []), "page"]
+
+        return tools
+
     def _try_extract_embedded_openapi(self, content: DocumentContent) -> ExtractionResult | None:
         """Try to extract embedded OpenAPI spec from HTML/JS.
 
@@ -220,9 +295,11 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
             ExtractionResult if successful, None otherwise
         """
         # FIRST: Try parsing the entire content as JSON (for pure JSON spec files)
-        if '"openapi"' in content.text and '"paths"' in content.text:
+        # Only text that starts like a JSON object is worth handing to the parser
+        text = content.text.lstrip()
+        if text.startswith("{") and '"openapi"' in text and '"paths"' in text:
             try:
-                spec = json.loads(content.text.strip())
+                spec = json_fast.loads(text)
                 if isinstance(spec, dict) and "paths" in spec:
                     logger.info(f"Found pure OpenAPI JSON spec in {content.url}")
                     return self._convert_openapi_to_result(spec, content.url)
@@ -234,10 +311,14 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
 
         # Look for OpenAPI spec patterns in code samples
         for sample in content.code_samples:
-            if '"paths"' in sample and ('"openapi"' in sample or '"swagger"' in sample):
+            if (
+                sample.startswith("{")
+                and '"paths"' in sample
+                and ('"openapi"' in sample or '"swagger"' in sample)
+            ):
                 try:
                     # Try to parse as JSON
-                    spec = json.loads(sample)
+                    spec = json_fast.loads(sample)
                     if isinstance(spec, dict) and "paths" in spec:
                         logger.info(
                             f"Found embedded OpenAPI spec in code sample from {content.url}"
@@ -272,64 +353,30 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
                 continue
 
             for method, operation in methods.items():
-                if not isinstance(operation, dict):
-                    # Skip non-dict entries (e.g., $ref, parameters, etc.)
+                method = method.lower()
+                # Skip non-operation entries (e.g., $ref, parameters, etc.)
+                if method not in _OPENAPI_METHODS or not isinstance(operation, dict):
                     continue
 
-                if method.lower() in ["get", "post", "put", "delete", "patch", "head", "options"]:
-                    try:
-                        # Extract parameters with error handling
-                        parameters = []
-                        for param in operation.get("parameters", []):
-                            try:
-                                if not isinstance(param, dict):
-                                    continue
-
-                                # Get parameter type from schema
-                                param_type = "string"  # default
-                                if "schema" in param and isinstance(param["schema"], dict):
-                                    param_type = param["schema"].get("type", "string")
-                                elif "type" in param:
-                                    param_type = param.get("type", "string")
-
-                                parameters.append(
-                                    Parameter(
-                                        name=param.get("name", "unknown"),
-                                        location=ParameterLocation(param.get("in", "query")),
-                                        description=param.get("description"),
-                                        required=param.get("required", False),
-                                        type=DataType(param_type),
-                                    )
-                                )
-                            except (KeyError, ValueError) as e:
-                                logger.warning(
-                                    f"Skipping invalid parameter in {method} {path}: {e}"
-                                )
-                                continue
-
-                        # Extract responses with error handling
-                        responses = []
-                        for status_code, response_info in operation.get("responses", {}).items():
-                            try:
-                                if not isinstance(response_info, dict):
-                                    continue
-
-                                responses.append(
-                                    Response(
-                                        status_code=str(status_code),
-                                        description=response_info.get("description", ""),
-                                    )
-                                )
-                            except (KeyError, ValueError) as e:
-                                logger.warning(
-                                    f"Skipping invalid response {status_code} in "
-                                    f"{method} {path}: {e}"
-                                )
-                                continue
-
-                        endpoint = Endpoint(
+                try:
+                    parameters = []
+                    for param in operation.get("parameters", []):
+                        parameter = self._parameter_from_spec(param, method, path)
+                        if parameter is not None:
+                            parameters.append(parameter)
+
+                    responses = []
+                    for status_code, response_info in operation.get("responses", {}).items():
+                        response = self._response_from_spec(
+                            status_code, response_info, method, path
+                        )
+                        if response is not None:
+                            responses.append(response)
+
+                    endpoints.append(
+                        Endpoint(
                             path=path,
-                            method=HTTPMethod(method.lower()),
+                            method=method,
                             summary=operation.get("summary", ""),
                             description=operation.get("description"),
                             tags=operation.get("tags", []),
@@ -338,12 +385,9 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
                             confidence=ConfidenceLevel.HIGH,
                             source_url=source_url,
                         )
-                        endpoints.append(endpoint)
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to parse endpoint {method} {path}: {e}", exc_info=True
-                        )
-                        continue
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to parse endpoint {method} {path}: {e}", exc_info=True)
 
         logger.info(f"Converted embedded OpenAPI spec: {len(endpoints)} endpoints")
         return ExtractionResult(
@@ -351,6 +395,67 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
             confidence=ConfidenceLevel.HIGH,
         )
 
+    @staticmethod
+    def _parameter_from_spec(param: object, method: str, path: str) -> Parameter | None:
+        """Convert an OpenAPI parameter object to a Parameter.
+
+        Args:
+            param: Parameter entry from the spec
+            method: Lowercase HTTP method of the operation (for logging)
+            path: Path of the operation (for logging)
+
+        Returns:
+            Parameter, or None if the entry is not a valid parameter
+        """
+        if not isinstance(param, dict):
+            return None
+
+        # Get parameter type from schema
+        schema = param.get("schema")
+        if isinstance(schema, dict):
+            param_type = schema.get("type", "string")
+        else:
+            param_type = param.get("type", "string")
+
+        try:
+            return Parameter(
+                name=param.get("name", "unknown"),
+                location=param.get("in", "query"),
+                description=param.get("description"),
+                required=param.get("required", False),
+                type=param_type,
+            )
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Skipping invalid parameter in {method} {path}: {e}")
+            return None
+
+    @staticmethod
+    def _response_from_spec(
+        status_code: object, response_info: object, method: str, path: str
+    ) -> Response | None:
+        """Convert an OpenAPI response object to a Response.
+
+        Args:
+            status_code: Status code key from the spec
+            response_info: Response entry from the spec
+            method: Lowercase HTTP method of the operation (for logging)
+            path: Path of the operation (for logging)
+
+        Returns:
+            Response, or None if the entry is not a valid response
+        """
+        if not isinstance(response_info, dict):
+            return None
+
+        try:
+            return Response(
+                status_code=str(status_code),
+                description=response_info.get("description", ""),
+            )
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Skipping invalid response {status_code} in {method} {path}: {e}")
+            return None
+
     async def extract(self, content: DocumentContent) -> ExtractionResult:
         """Extract API information from documentation content.
 
@@ -362,25 +467,192 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
         """
         logger.info(f"Extracting API info from {content.url}")
 
-        # FIRST: Try to detect and parse embedded OpenAPI specs directly
-        embedded_result = self._try_extract_embedded_openapi(content)
-        if embedded_result and len(embedded_result.endpoints) > 0:
-            logger.info(f"Using embedded OpenAPI spec ({len(embedded_result.endpoints)} endpoints)")
-            return embedded_result
+        local_result, content_hash = await self._extract_locally(content)
+        if local_result:
+            return local_result
+
+        # FALLBACK: Use LLM extraction
+        logger.info("No embedded OpenAPI found, using LLM extraction...")
+        doc_text = await self._build_doc_text(content)
+
+        return await self._extract_page_with_llm(content, content_hash, doc_text)
+
+    async def extract_many(self, contents: list[DocumentContent]) -> list[ExtractionResult]:
+        """Extract API information from several pages with a single LLM request.
+
+        Pages with an embedded OpenAPI spec or a cached result are resolved locally.
+        The remaining pages are packed into one prompt, each behind a ``---PAGE k---``
+        marker, and every tool call is routed back to its page via the "page" field.
+
+        Args:
+            contents: Documentation contents
+
+        Returns:
+            Extraction results, one per content and in the same order
 
-        # Check cache before LLM extraction
-        content_hash = self.cache_manager.get_content_hash(
-            content.text[:50000]
-        )  # Use first 50K chars for hash
-        cached_result = self.cache_manager.get_llm_cache(content_hash)
+        Raises:
+            ValueError: If the response cannot be mapped back onto the pages
+        """
+        results: list[ExtractionResult | None] = []
+        pending: list[tuple[int, DocumentContent, str, str]] = []
+
+        for index, content in enumerate(contents):
+            local_result, content_hash = await self._extract_locally(content)
+            results.append(local_result)
+            if local_result is None:
+                doc_text = await self._build_doc_text(content)
+                pending.append((index, content, content_hash, doc_text))
+
+        if len(pending) == 1:
+            index, content, content_hash, doc_text = pending[0]
+            results[index] = await self._extract_page_with_llm(content, content_hash, doc_text)
+
+        elif pending:
+            logger.info(f"Extracting API info from {len(pending)} pages in one LLM request")
+
+            documentation = "\n\n".join(
+                f"---PAGE {page}---\n{doc_text}"
+                for page, (_, _, _, doc_text) in enumerate(pending, 1)
+            )
+            prompt = self.MULTI_PAGE_PROMPT.replace("{page_count}", str(len(pending))).replace(
+                "{documentation}", documentation
+            )
+
+            response = await self._create_message(
+                prompt,
+                self.MULTI_PAGE_SYSTEM_PROMPT,
+                self._multi_page_tools,
+                # One response still has a single output limit, however many pages
+                max_tokens=min(
+                    sum(self._estimate_max_tokens(doc_text) for _, _, _, doc_text in pending),
+                    MAX_OUTPUT_TOKENS,
+                ),
+            )
+
+            blocks_by_page = self._group_blocks_by_page(response, len(pending))
+
+            for page, (index, content, content_hash, doc_text) in enumerate(pending, 1):
+                result = await asyncio.to_thread(
+                    self._parse_tool_blocks, blocks_by_page[page], content.url
+                )
+                results[index] = self._finalize_result(result, doc_text, content_hash, content.url)
+
+        return results
+
+    async def extract_batch(self, contents: list[DocumentContent]) -> list[ExtractionResult]:
+        """Extract API information from many pages through the Message Batches API.
+
+        Pages with an embedded OpenAPI spec or a cached result are resolved locally.
+        The remaining pages are submitted as one message batch, which is billed at a
+        discount but may take minutes to complete, so this suits bulk runs rather than
+        latency-sensitive callers.
+
+        Args:
+            contents: Documentation contents
+
+        Returns:
+            Extraction results, one per content and in the same order (empty with low
+            confidence for pages whose batch request failed)
+        """
+        results: list[ExtractionResult | None] = []
+        pending: dict[str, tuple[int, DocumentContent, str, str]] = {}
+
+        for index, content in enumerate(contents):
+            local_result, content_hash = await self._extract_locally(content)
+            results.append(local_result)
+            if local_result is None:
+                doc_text = await self._build_doc_text(content)
+                pending[f"page-{index}"] = (index, content, content_hash, doc_text)
+
+        if pending:
+            logger.info(f"Submitting {len(pending)} pages to the Message Batches API")
+
+            await self.rate_limiter.acquire()
+            batch = await self.client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": custom_id,
+                        "params": {
+                            "model": self.settings.anthropic_model,
+                            "max_tokens": self._estimate_max_tokens(doc_text),
+                            "tools": self._tools,
+                            "system": self._cached_system(self.EXTRACTION_SYSTEM_PROMPT),
+                            "messages": [
+                                {
+                                    "role": "user",
+                                    "content": self.EXTRACTION_PROMPT.replace(
+                                        "{documentation}", doc_text
+                                    ),
+                                }
+                            ],
+                        },
+                    }
+                    for custom_id, (_, _, _, doc_text) in pending.items()
+                ]
+            )
+
+            interval = BATCH_POLL_INITIAL_INTERVAL
+            while batch.processing_status != "ended":
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, BATCH_POLL_MAX_INTERVAL)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+                logger.debug(f"Message batch {batch.id}: {batch.request_counts}")
+
+            async for entry in await self.client.messages.batches.results(batch.id):
+                index, content, content_hash, doc_text = pending[entry.custom_id]
+                if entry.result.type != "succeeded":
+                    logger.error(f"Batch extraction {entry.result.type} for {content.url}")
+                    continue
+
+                self._log_cache_usage(entry.result.message)
+                result = await asyncio.to_thread(
+                    self._parse_response, entry.result.message, content.url
+                )
+                results[index] = self._finalize_result(result, doc_text, content_hash, content.url)
+
+        return [
+            result if result is not None else ExtractionResult(confidence=ConfidenceLevel.LOW)
+            for result in results
+        ]
+
+    async def _extract_locally(
+        self, content: DocumentContent
+    ) -> tuple[ExtractionResult | None, str]:
+        """Resolve a page without the LLM, from the LLM cache or an embedded spec.
+
+        Args:
+            content: Documentation content
+
+        Returns:
+            Tuple of (result or None, content hash used as the LLM cache key)
+        """
+        # Check the cache first so cached pages skip embedded-spec parsing too. The
+        # whole text is hashed: specs often share their first tens of KB across versions
+        content_hash = self.cache_manager.get_content_hash(content.text)
+        cached_result = self.cache_manager.get_llm_cache(content_hash) if self.use_cache else None
         if cached_result:
             logger.info(f" Using cached LLM result for {content.url}")
-            return cached_result
+            return cached_result, content_hash
 
-        # FALLBACK: Use LLM extraction
-        logger.info("No embedded OpenAPI found, using LLM extraction...")
+        # Try embedded OpenAPI specs next, off the event loop since parsing and
+        # converting a large spec is CPU-bound
+        embedded_result = await asyncio.to_thread(self._try_extract_embedded_openapi, content)
+        if embedded_result and len(embedded_result.endpoints) > 0:
+            logger.info(f"Using embedded OpenAPI spec ({len(embedded_result.endpoints)} endpoints)")
+            self.cache_manager.set_llm_cache(content_hash, embedded_result)
+            return embedded_result, content_hash
 
-        # Prepare documentation text
+        return None, content_hash
+
+    async def _build_doc_text(self, content: DocumentContent) -> str:
+        """Build the documentation text sent to the LLM for a page.
+
+        Args:
+            content: Documentation content
+
+        Returns:
+            Documentation text including code samples, within the token budget
+        """
         doc_text = f"URL: {content.url}\nTitle: {content.title}\n\n{content.text}"
 
         # Add code samples
@@ -389,50 +661,249 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
             for i, sample in enumerate(content.code_samples[:10], 1):  # Limit to 10 samples
                 doc_text += f"\nSample {i}:\n```\n{sample}\n```\n"
 
-        # Truncate if too long (roughly 150K tokens for safety)
-        max_chars = 600000
-        if len(doc_text) > max_chars:
-            logger.warning(f"Documentation too long ({len(doc_text)} chars), truncating")
-            doc_text = doc_text[:max_chars] + "\n\n[... truncated ...]"
+        return await self._fit_to_token_budget(doc_text)
+
+    async def _fit_to_token_budget(self, doc_text: str) -> str:
+        """Truncate documentation text to MAX_DOC_TOKENS.
+
+        Long texts are measured with the token counting endpoint and the cut point is
+        found by bisection, since characters per token range from about 2 for code to
+        8 for prose.
+
+        Args:
+            doc_text: Documentation text
+
+        Returns:
+            The text, truncated if it exceeds the token budget
+        """
+        if len(doc_text) < TOKEN_COUNT_MIN_CHARS:
+            return doc_text
+
+        try:
+            if await self._count_tokens(doc_text) <= MAX_DOC_TOKENS:
+                return doc_text
+
+            fits, too_long = 0, len(doc_text)
+            while too_long - fits > TRUNCATION_PRECISION_CHARS:
+                middle = (fits + too_long) // 2
+                if await self._count_tokens(doc_text[:middle]) <= MAX_DOC_TOKENS:
+                    fits = middle
+                else:
+                    too_long = middle
+            cut = fits
+        except Exception as e:
+            logger.warning(f"Token counting failed ({e}), truncating by characters")
+            if len(doc_text) <= MAX_DOC_CHARS:
+                return doc_text
+            cut = MAX_DOC_CHARS
+
+        logger.warning(f"Documentation too long ({len(doc_text)} chars), truncating to {cut}")
+        return doc_text[:cut] + "\n\n[... truncated ...]"
+
+    async def _count_tokens(self, text: str) -> int:
+        """Count the tokens of a user message with the token counting endpoint.
+
+        Args:
+            text: Message text
+
+        Returns:
+            Input token count
+        """
+        count = await self.client.messages.count_tokens(
+            model=self.settings.anthropic_model,
+            messages=[{"role": "user", "content": text}],
+        )
+        return count.input_tokens
+
+    @staticmethod
+    def _estimate_max_tokens(doc_text: str) -> int:
+        """Estimate the output token budget for one page from its endpoint density.
 
+        Args:
+            doc_text: Documentation text to send
+
+        Returns:
+            max_tokens between MIN_OUTPUT_TOKENS and MAX_OUTPUT_TOKENS
+        """
+        hints = sum(1 for _ in _ENDPOINT_HINT_RE.finditer(doc_text))
+        return min(MIN_OUTPUT_TOKENS + OUTPUT_TOKENS_PER_ENDPOINT * hints, MAX_OUTPUT_TOKENS)
+
+    async def _extract_page_with_llm(
+        self, content: DocumentContent, content_hash: str, doc_text: str
+    ) -> ExtractionResult:
+        """Extract API information from a single page with the LLM.
+
+        Args:
+            content: Documentation content
+            content_hash: LLM cache key for the content
+            doc_text: Documentation text to send
+
+        Returns:
+            Extraction result (empty with low confidence on failure)
+        """
         # Call Claude with tools
         try:
             # Use replace instead of format to avoid issues with curly braces in documentation
             prompt = self.EXTRACTION_PROMPT.replace("{documentation}", doc_text)
 
-            response = self.client.messages.create(
-                model=self.settings.anthropic_model,
-                max_tokens=4096,
-                tools=self._create_extraction_tools(),
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
+            max_tokens = self._estimate_max_tokens(doc_text)
+            response = await self._create_message(
+                prompt, self.EXTRACTION_SYSTEM_PROMPT, self._tools, max_tokens=max_tokens
             )
 
-            # Parse tool uses into structured data
-            result = self._parse_response(response, content.url)
-
-            # Enhance security schemes with pattern-based detection
-            result.security_schemes = self.auth_detector.enhance_llm_schemes(
-                result.security_schemes, doc_text
-            )
+            # The estimate was too low: retry with a doubled budget rather than keep a
+            # truncated endpoint list
+            while response.stop_reason == "max_tokens" and max_tokens < MAX_OUTPUT_TOKENS:
+                max_tokens = min(max_tokens * 2, MAX_OUTPUT_TOKENS)
+                logger.info(
+                    f"Response for {content.url} hit max_tokens, retrying with {max_tokens}"
+                )
+                response = await self._create_message(
+                    prompt, self.EXTRACTION_SYSTEM_PROMPT, self._tools, max_tokens=max_tokens
+                )
 
-            # Cache the result
-            self.cache_manager.set_llm_cache(content_hash, result)
+            # Parse tool uses into structured data
+            result = await asyncio.to_thread(self._parse_response, response, content.url)
 
-            logger.info(
-                f"Extracted {len(result.endpoints)} endpoints and "
-                f"{len(result.security_schemes)} auth schemes from {content.url}"
-            )
-            return result
+            return self._finalize_result(result, doc_text, content_hash, content.url)
 
         except Exception as e:
             logger.error(f"LLM extraction failed for {content.url}: {e}", exc_info=True)
             return ExtractionResult(confidence=ConfidenceLevel.LOW)
 
+    async def _create_message(
+        self, prompt: str, system_prompt: str, tools: list[dict], max_tokens: int
+    ) -> anthropic.types.Message:
+        """Send an extraction request to Claude, streaming the response.
+
+        Multi-page responses can run to tens of thousands of tokens. Streaming keeps
+        the connection busy while they are generated, so they are neither cut off by
+        idle timeouts nor refused by the SDK's long-request guard for non-streaming
+        calls.
+
+        Args:
+            prompt: User message with the documentation
+            system_prompt: Static system prompt (sent as a prompt-cache breakpoint)
+            tools: Tool definitions
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            The complete response message
+        """
+        await self.rate_limiter.acquire()
+        async with self.client.messages.stream(
+            model=self.settings.anthropic_model,
+            max_tokens=max_tokens,
+            tools=tools,
+            system=self._cached_system(system_prompt),
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+        ) as stream:
+            response = await stream.get_final_message()
+
+        self._log_cache_usage(response)
+        return response
+
+    @staticmethod
+    def _cached_system(prompt: str) -> list[dict]:
+        """Build a system prompt marked as a prompt-cache breakpoint.
+
+        Tools precede the system prompt in the cached prefix, so one breakpoint here
+        covers both the tool definitions and the instructions.
+
+        Args:
+            prompt: Static system prompt text
+
+        Returns:
+            System content blocks
+        """
+        return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+    @staticmethod
+    def _log_cache_usage(response: anthropic.types.Message) -> None:
+        """Log prompt cache hits and writes for a response.
+
+        Args:
+            response: Claude's response
+        """
+        usage = response.usage
+        logger.debug(
+            f"Prompt cache: {usage.cache_read_input_tokens or 0} tokens read, "
+            f"{usage.cache_creation_input_tokens or 0} tokens written, "
+            f"{usage.input_tokens} uncached input tokens"
+        )
+
+    def _finalize_result(
+        self, result: ExtractionResult, doc_text: str, content_hash: str, source_url: str
+    ) -> ExtractionResult:
+        """Enhance an LLM result with pattern-based auth detection and cache it.
+
+        Args:
+            result: Parsed extraction result
+            doc_text: Documentation text the result was extracted from
+            content_hash: LLM cache key for the content
+            source_url: Source URL
+
+        Returns:
+            The enhanced extraction result
+        """
+        # Enhance security schemes with pattern-based detection
+        result.security_schemes = self.auth_detector.enhance_llm_schemes(
+            result.security_schemes, doc_text
+        )
+
+        # Cache the result
+        self.cache_manager.set_llm_cache(content_hash, result)
+
+        logger.info(
+            f"Extracted {len(result.endpoints)} endpoints and "
+            f"{len(result.security_schemes)} auth schemes from {source_url}"
+        )
+        return result
+
+    def _group_blocks_by_page(
+        self, response: anthropic.types.Message, page_count: int
+    ) -> dict[int, list]:
+        """Route the tool calls of a multi-page response back to their pages.
+
+        Args:
+            response: Claude's response to a multi-page prompt
+            page_count: Number of pages in the prompt
+
+        Returns:
+            Dictionary mapping page number (1-based) to its tool_use blocks
+
+        Raises:
+            ValueError: If the response was truncated or a tool call has no valid page
+        """
+        if response.stop_reason == "max_tokens":
+            raise ValueError("Multi-page response was truncated at max_tokens")
+
+        blocks_by_page: dict[int, list] = {page: [] for page in range(1, page_count + 1)}
+
+        for content_block in response.content:
+            if content_block.type != "tool_use":
+                continue
+
+            try:
+                page = int(content_block.input.get("page"))
+            except (TypeError, ValueError):
+                page = None
+
+            if page not in blocks_by_page:
+                raise ValueError(
+                    f"{content_block.name} call references unknown page "
+                    f"{content_block.input.get('page')!r}"
+                )
+
+            blocks_by_page[page].append(content_block)
+
+        return blocks_by_page
+
     def _parse_response(
         self, response: anthropic.types.Message, source_url: str
     ) -> ExtractionResult:
@@ -442,6 +913,18 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
             response: Claude's response
             source_url: Source URL
 
+        Returns:
+            Parsed extraction result
+        """
+        return self._parse_tool_blocks(response.content, source_url)
+
+    def _parse_tool_blocks(self, content_blocks: list, source_url: str) -> ExtractionResult:
+        """Parse tool_use content blocks into ExtractionResult.
+
+        Args:
+            content_blocks: Content blocks from Claude's response
+            source_url: Source URL
+
         Returns:
             Parsed extraction result
         """
@@ -451,7 +934,7 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
         api_description: str | None = None
         base_url: str | None = None
 
-        for content_block in response.content:
+        for content_block in content_blocks:
             if content_block.type == "tool_use":
                 if content_block.name == "record_endpoint":
                     endpoint = self._parse_endpoint(content_block.input, source_url)
@@ -503,10 +986,10 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
         for param_data in data.get("parameters", []):
             param = Parameter(
                 name=param_data["name"],
-                location=ParameterLocation(param_data["location"]),
+                location=param_data["location"],
                 description=param_data.get("description"),
                 required=param_data.get("required", False),
-                type=DataType(param_data.get("type", "string")),
+                type=param_data.get("type", "string"),
                 example=param_data.get("example"),
             )
             parameters.append(param)
@@ -551,14 +1034,14 @@ Now extract ALL endpoints by calling record_endpoint for each one."""
 
         return Endpoint(
             path=data["path"],
-            method=HTTPMethod(data["method"]),
+            method=data["method"],
             summary=data.get("summary"),
             description=data.get("description"),
             tags=data.get("tags", []),
             parameters=parameters,
             request_body=request_body,
             responses=responses,
-            confidence=ConfidenceLevel(data.get("confidence", "medium")),
+            confidence=data.get("confidence", "medium"),
             source_url=source_url,
         )
 
@@ -1,32 +1,94 @@
 """Playwright-based renderer for JavaScript-heavy sites."""
 
-from playwright.async_api import Browser, async_playwright
+import asyncio
+
+from playwright.async_api import Browser, Playwright, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from openapi_generator.config import get_settings
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# How long to wait for the network to go quiet after the DOM is ready (ms)
+NETWORK_IDLE_TIMEOUT_MS = 2000
+
+# Resource types that carry no documentation text
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
 
 class JavaScriptRenderer:
-    """Renders JavaScript-heavy pages using Playwright."""
+    """Renders JavaScript-heavy pages using Playwright.
+
+    The browser is launched on the first render and reused for later pages until
+    ``close()`` is called or the ``async with`` block exits.
+    """
 
     def __init__(self):
         """Initialize renderer."""
         self.settings = get_settings()
+        self._playwright: Playwright | None = None
         self._browser: Browser | None = None
+        self._launch_lock = asyncio.Lock()
+        self._render_semaphore = asyncio.Semaphore(self.settings.render_concurrency)
 
     async def __aenter__(self) -> "JavaScriptRenderer":
-        """Async context manager entry."""
+        """Async context manager entry (the browser is launched lazily)."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
         await self.close()
 
+    async def _get_browser(self) -> Browser:
+        """Get the shared browser, launching it on first use.
+
+        Returns:
+            Running Chromium browser
+        """
+        async with self._launch_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
     async def render_page(self, url: str, wait_for_selector: str | None = None) -> str:
         """Render a page with JavaScript execution.
 
+        Args:
+            url: URL to render
+            wait_for_selector: Optional CSS selector to wait for before extracting content
+
+        Returns:
+            Rendered HTML content
+        """
+        async with self._render_semaphore:
+            return await self._render(url, wait_for_selector)
+
+    async def render_many(self, urls: list[str]) -> dict[str, str]:
+        """Render several pages concurrently, up to render_concurrency at a time.
+
+        Args:
+            urls: URLs to render
+
+        Returns:
+            Dictionary mapping URL to rendered HTML (pages that failed are omitted)
+        """
+        pages = await asyncio.gather(
+            *(self.render_page(url) for url in urls), return_exceptions=True
+        )
+
+        results = {}
+        for url, html in zip(urls, pages):
+            if isinstance(html, Exception):
+                logger.error(f"Failed to render {url}: {html}")
+            else:
+                results[url] = html
+        return results
+
+    async def _render(self, url: str, wait_for_selector: str | None) -> str:
+        """Render one page in its own browser context.
+
         Args:
             url: URL to render
             wait_for_selector: Optional CSS selector to wait for before extracting content
@@ -36,37 +98,57 @@ class JavaScriptRenderer:
         """
         logger.info(f"Rendering JavaScript page: {url}")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page(
-                    user_agent=self.settings.user_agent,
-                )
+        browser = await self._get_browser()
+        # new_page() opens a fresh context, so cookies and storage don't leak between pages
+        page = await browser.new_page(
+            user_agent=self.settings.user_agent,
+        )
+        try:
+            if self.settings.render_block_assets:
+                await page.route("**/*", self._block_assets)
+
+            # Set timeout
+            page.set_default_timeout(self.settings.request_timeout * 1000)  # Convert to ms
 
-                # Set timeout
-                page.set_default_timeout(self.settings.request_timeout * 1000)  # Convert to ms
+            # Navigate to page
+            await page.goto(url, wait_until="domcontentloaded")
 
-                # Navigate to page
-                await page.goto(url, wait_until="networkidle")
+            # Wait for specific selector if provided
+            if wait_for_selector:
+                await page.wait_for_selector(wait_for_selector, timeout=10000)
+            else:
+                # Give dynamic content a moment to load, but don't wait on chatty pages
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    logger.debug(f"Network still busy on {url}, using current DOM")
 
-                # Wait for specific selector if provided
-                if wait_for_selector:
-                    await page.wait_for_selector(wait_for_selector, timeout=10000)
-                else:
-                    # Wait a bit for dynamic content to load
-                    await page.wait_for_timeout(2000)
+            # Get rendered HTML
+            html = await page.content()
 
-                # Get rendered HTML
-                html = await page.content()
+            logger.debug(f"Successfully rendered {url} ({len(html)} chars)")
+            return html
 
-                logger.debug(f"Successfully rendered {url} ({len(html)} chars)")
-                return html
+        finally:
+            await page.close()
 
-            finally:
-                await browser.close()
+    @staticmethod
+    async def _block_assets(route: Route) -> None:
+        """Abort requests for assets that don't affect page text.
+
+        Args:
+            route: Intercepted request route
+        """
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def close(self) -> None:
         """Close browser if open."""
         if self._browser:
             await self._browser.close()
             self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
@@ -1,24 +1,34 @@
 """OpenAPI specification builder."""
 
-import json
 import re
-from collections import defaultdict
+import sys
 from typing import Any
 from urllib.parse import urlparse
 
-import yaml
-
 from openapi_generator.models.schemas import (
+    ConfidenceLevel,
     Endpoint,
     ExtractionResult,
     OpenAPIInfo,
     OpenAPISpec,
     Server,
 )
+from openapi_generator.utils import yaml_fast
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Confidence levels mapped to numeric values for comparison
+_CONFIDENCE_SCORES = {
+    ConfidenceLevel.HIGH: 3,
+    ConfidenceLevel.MEDIUM: 2,
+    ConfidenceLevel.LOW: 1,
+}
+
+# Operation ID cleanup: path parameters become "by_id", other punctuation "_"
+_PATH_PARAM_RE = re.compile(r"\{.*?\}")
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+
 
 class OpenAPIBuilder:
     """Builds OpenAPI 3.0 specification from extraction results."""
@@ -31,6 +41,8 @@ class OpenAPIBuilder:
         """
         self.base_url = base_url
         self.endpoints: list[Endpoint] = []
+        # (method, path) -> index in self.endpoints, for add-time deduplication
+        self._endpoint_index: dict[tuple[str, str], int] = {}
         self.security_schemes: list[Any] = []
         self.api_title: str | None = None
         self.api_description: str | None = None
@@ -43,7 +55,8 @@ class OpenAPIBuilder:
             results: List of extraction results
         """
         for result in results:
-            self.endpoints.extend(result.endpoints)
+            for endpoint in result.endpoints:
+                self._add_endpoint(endpoint)
             self.security_schemes.extend(result.security_schemes)
 
             # Use first non-None metadata
@@ -54,33 +67,70 @@ class OpenAPIBuilder:
             if not self.detected_base_url and result.base_url:
                 self.detected_base_url = result.base_url
 
+    def _add_endpoint(self, endpoint: Endpoint) -> None:
+        """Add an endpoint, merging it with an existing one for the same method and path.
+
+        Args:
+            endpoint: Endpoint to add
+        """
+        # Interned paths make the repeated key comparisons pointer checks
+        key = (endpoint.method.value, sys.intern(endpoint.path))
+        index = self._endpoint_index.get(key)
+
+        if index is None:
+            self._endpoint_index[key] = len(self.endpoints)
+            self.endpoints.append(endpoint)
+        elif self._is_preferred(endpoint, self.endpoints[index]):
+            self.endpoints[index] = endpoint
+
+    @staticmethod
+    def _is_preferred(candidate: Endpoint, existing: Endpoint) -> bool:
+        """Check whether a duplicate endpoint should replace the existing one.
+
+        Higher confidence wins; on equal confidence the more detailed endpoint wins.
+
+        Args:
+            candidate: Newly seen endpoint
+            existing: Endpoint currently kept
+
+        Returns:
+            True if the candidate should replace the existing endpoint
+        """
+        candidate_score = _CONFIDENCE_SCORES[candidate.confidence]
+        existing_score = _CONFIDENCE_SCORES[existing.confidence]
+        if candidate_score != existing_score:
+            return candidate_score > existing_score
+
+        def richness(endpoint: Endpoint) -> int:
+            return (
+                len(endpoint.parameters)
+                + len(endpoint.responses)
+                + (endpoint.request_body is not None)
+            )
+
+        return richness(candidate) > richness(existing)
+
     def build(self) -> OpenAPISpec:
         """Build OpenAPI specification.
 
         Returns:
             Complete OpenAPI specification
         """
+        # Endpoints are deduplicated as they are added, so they are already unique
         logger.info(f"Building OpenAPI spec with {len(self.endpoints)} endpoints")
 
-        # Deduplicate endpoints
-        unique_endpoints = self._deduplicate_endpoints()
-        logger.info(f"After deduplication: {len(unique_endpoints)} unique endpoints")
-
         # Generate info section
         info = self._build_info()
 
         # Generate servers section
         servers = self._build_servers()
 
-        # Generate paths section
-        paths = self._build_paths(unique_endpoints)
+        # Generate paths and tags sections
+        paths, tags = self._build_paths_and_tags(self.endpoints)
 
         # Generate components section
         components = self._build_components()
 
-        # Generate tags
-        tags = self._build_tags(unique_endpoints)
-
         spec = OpenAPISpec(
             openapi="3.0.3",
             info=info,
@@ -93,41 +143,6 @@ class OpenAPIBuilder:
         logger.info("OpenAPI spec built successfully")
         return spec
 
-    def _deduplicate_endpoints(self) -> list[Endpoint]:
-        """Remove duplicate endpoints based on path and method.
-
-        Returns:
-            List of unique endpoints
-        """
-        # Map confidence levels to numeric values for comparison
-        confidence_scores = {
-            "high": 3,
-            "medium": 2,
-            "low": 1,
-        }
-
-        seen = {}
-        unique = []
-
-        for endpoint in self.endpoints:
-            key = (endpoint.path, endpoint.method.value)
-
-            if key not in seen:
-                seen[key] = endpoint
-                unique.append(endpoint)
-            else:
-                # If we've seen this before, keep the one with higher confidence
-                current_score = confidence_scores.get(endpoint.confidence.value, 0)
-                existing_score = confidence_scores.get(seen[key].confidence.value, 0)
-
-                if current_score > existing_score:
-                    # Remove old one and add new one
-                    unique.remove(seen[key])
-                    seen[key] = endpoint
-                    unique.append(endpoint)
-
-        return unique
-
     def _build_info(self) -> OpenAPIInfo:
         """Build info section.
 
@@ -159,30 +174,43 @@ class OpenAPIBuilder:
 
         return [Server(url=server_url, description="API server")]
 
-    def _build_paths(self, endpoints: list[Endpoint]) -> dict[str, dict[str, Any]]:
-        """Build paths section.
+    def _build_paths_and_tags(
+        self, endpoints: list[Endpoint]
+    ) -> tuple[dict[str, dict[str, Any]], list[dict[str, str]] | None]:
+        """Build paths and tags sections in one pass over the endpoints.
 
         Args:
             endpoints: List of unique endpoints
 
         Returns:
-            Paths dictionary
+            Tuple of (paths dictionary, list of tag dictionaries or None)
         """
-        paths: dict[str, dict[str, Any]] = defaultdict(dict)
+        paths: dict[str, dict[str, Any]] = {}
+        tag_set: set[str] = set()
 
         for endpoint in endpoints:
-            # Normalize path
+            # Endpoint paths are normalized to a leading "/" on validation
             path = endpoint.path
-            if not path.startswith("/"):
-                path = f"/{path}"
 
             # Build operation object
             operation = self._build_operation(endpoint)
 
             # Add to paths
-            paths[path][endpoint.method.value] = operation
+            path_item = paths.get(path)
+            if path_item is None:
+                paths[path] = {endpoint.method.value: operation}
+            else:
+                path_item[endpoint.method.value] = operation
 
-        return dict(paths)
+            if endpoint.tags:
+                tag_set.update(endpoint.tags)
+
+        tags = (
+            [{"name": tag, "description": f"{tag} endpoints"} for tag in sorted(tag_set)]
+            if tag_set
+            else None
+        )
+        return paths, tags
 
     def _build_operation(self, endpoint: Endpoint) -> dict[str, Any]:
         """Build operation object for an endpoint.
@@ -217,51 +245,49 @@ class OpenAPIBuilder:
             ]
 
         # Request body
-        if endpoint.request_body:
-            operation["requestBody"] = {
-                "description": endpoint.request_body.description or "",
-                "required": endpoint.request_body.required,
-                "content": {
-                    endpoint.request_body.content_type: {
-                        "schema": (
-                            self._build_schema_dict(endpoint.request_body.schema_)
-                            if endpoint.request_body.schema_
-                            else {"type": "object"}
-                        ),
-                    }
-                },
+        request_body = endpoint.request_body
+        if request_body:
+            media_type: dict[str, Any] = {
+                "schema": (
+                    self._build_schema_dict(request_body.schema_)
+                    if request_body.schema_
+                    else {"type": "object"}
+                ),
             }
 
             # Add example if available
-            if endpoint.request_body.example:
-                operation["requestBody"]["content"][endpoint.request_body.content_type][
-                    "example"
-                ] = endpoint.request_body.example
+            if request_body.example:
+                media_type["example"] = request_body.example
+
+            operation["requestBody"] = {
+                "description": request_body.description or "",
+                "required": request_body.required,
+                "content": {request_body.content_type: media_type},
+            }
 
         # Responses
-        operation["responses"] = {}
+        responses: dict[str, Any] = {}
         if endpoint.responses:
             for response in endpoint.responses:
-                operation["responses"][response.status_code] = {
-                    "description": response.description,
-                }
+                response_dict: dict[str, Any] = {"description": response.description}
 
                 if response.schema_:
-                    operation["responses"][response.status_code]["content"] = {
-                        response.content_type: {"schema": self._build_schema_dict(response.schema_)}
-                    }
+                    media_type = {"schema": self._build_schema_dict(response.schema_)}
 
                     # Add example if available
                     if response.example:
-                        operation["responses"][response.status_code]["content"][
-                            response.content_type
-                        ]["example"] = response.example
+                        media_type["example"] = response.example
+
+                    response_dict["content"] = {response.content_type: media_type}
+
+                responses[response.status_code] = response_dict
         else:
             # Default response
-            operation["responses"]["200"] = {
+            responses["200"] = {
                 "description": "Successful response",
                 "content": {"application/json": {"schema": {"type": "object"}}},
             }
+        operation["responses"] = responses
 
         # Deprecated flag
         if endpoint.deprecated:
@@ -357,24 +383,6 @@ class OpenAPIBuilder:
 
         return components if components else None
 
-    def _build_tags(self, endpoints: list[Endpoint]) -> list[dict[str, str]] | None:
-        """Build tags section.
-
-        Args:
-            endpoints: List of endpoints
-
-        Returns:
-            List of tag dictionaries
-        """
-        tag_set = set()
-        for endpoint in endpoints:
-            tag_set.update(endpoint.tags or [])
-
-        if not tag_set:
-            return None
-
-        return [{"name": tag, "description": f"{tag} endpoints"} for tag in sorted(tag_set)]
-
     def _generate_operation_id(self, endpoint: Endpoint) -> str:
         """Generate operation ID for an endpoint.
 
@@ -386,8 +394,8 @@ class OpenAPIBuilder:
         """
         # Clean path to create operation ID
         path = endpoint.path.strip("/")
-        path = re.sub(r"\{.*?\}", "by_id", path)  # Replace path params
-        path = re.sub(r"[^a-zA-Z0-9]+", "_", path)  # Replace special chars
+        path = _PATH_PARAM_RE.sub("by_id", path)  # Replace path params
+        path = _NON_ALNUM_RE.sub("_", path)  # Replace special chars
 
         return f"{endpoint.method.value}_{path}".lower()
 
@@ -396,12 +404,12 @@ class OpenAPIBuilder:
 
         Args:
             spec: OpenAPI specification
-            indent: Indentation level
+            indent: Indentation level (0 for compact output)
 
         Returns:
             JSON string
         """
-        return json.dumps(spec.model_dump(by_alias=True, exclude_none=True), indent=indent)
+        return spec.model_dump_json(by_alias=True, exclude_none=True, indent=indent or None)
 
     def to_yaml(self, spec: OpenAPISpec) -> str:
         """Convert spec to YAML string.
@@ -412,8 +420,4 @@ class OpenAPIBuilder:
         Returns:
             YAML string
         """
-        return yaml.dump(
-            spec.model_dump(by_alias=True, exclude_none=True),
-            default_flow_style=False,
-            sort_keys=False,
-        )
+        return yaml_fast.dump(spec.model_dump(mode="json", by_alias=True, exclude_none=True))
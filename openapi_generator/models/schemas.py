@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class HTTPMethod(str, Enum):
@@ -125,6 +125,12 @@ class Endpoint(BaseModel):
     )
     source_url: str | None = Field(None, description="URL where this endpoint was found")
 
+    @field_validator("path")
+    @classmethod
+    def _ensure_leading_slash(cls, path: str) -> str:
+        """Normalize the path to start with "/" as OpenAPI path keys require."""
+        return path if path.startswith("/") else f"/{path}"
+
 
 class SecurityScheme(BaseModel):
     """Security scheme model."""
@@ -2,33 +2,48 @@
 
 import asyncio
 
+import httpx
+
 from openapi_generator.config import get_settings
 from openapi_generator.extractors.content import ContentExtractor, DocumentContent
 from openapi_generator.extractors.discovery import DocumentationDiscovery
 from openapi_generator.extractors.llm_extractor import LLMExtractor
 from openapi_generator.extractors.renderer import JavaScriptRenderer
-from openapi_generator.models.schemas import ExtractionResult
+from openapi_generator.models.schemas import ConfidenceLevel, ExtractionResult
+from openapi_generator.utils.cache import get_cache_manager
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Token budget for one multi-page LLM request (leaves headroom in a 200K context)
+MAX_BATCH_TOKENS = 120_000
+# Pages are budgeted at 2 chars per token rather than token_estimate's 4: code-heavy
+# docs tokenize at close to 2, and an overfull batch fails and is redone page by page
+BATCH_CHARS_PER_TOKEN = 2
+
+# Pages buffered between fetching and LLM extraction in the pipelined run
+PIPELINE_QUEUE_SIZE = 32
+
 
 class OpenAPIOrchestrator:
     """Orchestrates the OpenAPI generation pipeline."""
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, force_refresh: bool = False):
         """Initialize orchestrator.
 
         Args:
             base_url: Base URL to generate spec from
+            force_refresh: Ignore cached discovery, page and LLM results
         """
         self.base_url = base_url
+        self.force_refresh = force_refresh
         self.settings = get_settings()
+        self.cache_manager = get_cache_manager()
 
         # Initialize components
         self.discovery = DocumentationDiscovery(base_url)
-        self.content_extractor = ContentExtractor()
-        self.llm_extractor = LLMExtractor()
+        self.content_extractor = ContentExtractor(use_cache=not force_refresh)
+        self.llm_extractor = LLMExtractor(use_cache=not force_refresh)
         self.js_renderer = JavaScriptRenderer()
 
         # Results
@@ -46,7 +61,7 @@ class OpenAPIOrchestrator:
 
         # Stage 1: Discover documentation pages
         logger.info("Stage 1: Discovering documentation pages...")
-        self.doc_urls = await self.discovery.discover()
+        self.doc_urls = await self.discover()
 
         if not self.doc_urls:
             logger.error("No documentation URLs found!")
@@ -54,24 +69,42 @@ class OpenAPIOrchestrator:
 
         logger.info(f"Found {len(self.doc_urls)} documentation URLs")
 
-        # Stage 2: Extract content from pages
-        logger.info("Stage 2: Extracting content from documentation pages...")
-        self.extracted_content = await self._extract_content_from_urls(self.doc_urls)
+        # Stages 2+3: Extract content and run LLM extraction as pages arrive
+        logger.info("Stage 2/3: Extracting content and API information (pipelined)...")
+        self.extraction_results = await self._extract_pipelined(self.doc_urls)
 
         if not self.extracted_content:
             logger.error("No content extracted!")
             return []
 
         logger.info(f"Extracted content from {len(self.extracted_content)} pages")
-
-        # Stage 3: LLM-powered extraction (map-reduce pattern)
-        logger.info("Stage 3: Extracting API information with LLM...")
-        self.extraction_results = await self._extract_with_llm(self.extracted_content)
-
         logger.info(f"Extraction complete! Processed {len(self.extraction_results)} pages")
 
         return self.extraction_results
 
+    async def discover(self) -> list[str]:
+        """Discover documentation URLs, reusing a cached discovery for this site.
+
+        Returns:
+            List of discovered documentation URLs
+        """
+        cache_key = (
+            f"{self.base_url}|pages={self.settings.max_pages_per_site}"
+            f"|depth={self.settings.max_depth}"
+        )
+
+        if not self.force_refresh:
+            cached_urls = self.cache_manager.get_discovery_cache(cache_key)
+            if cached_urls:
+                logger.info(f"Using cached discovery for {self.base_url}")
+                return cached_urls
+
+        doc_urls = await self.discovery.discover()
+        if doc_urls:
+            self.cache_manager.set_discovery_cache(cache_key, doc_urls)
+
+        return doc_urls
+
     async def _extract_content_from_urls(self, urls: list[str]) -> list[DocumentContent]:
         """Extract content from URLs with SPA detection.
 
@@ -81,32 +114,193 @@ class OpenAPIOrchestrator:
         Returns:
             List of extracted document content
         """
-        contents = []
+        max_concurrent = self.settings.max_concurrent_requests
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        # The renderer's browser is shared by all SPA pages and closed afterwards
+        async with self.content_extractor.create_client(max_concurrent) as client, self.js_renderer:
+            contents = await asyncio.gather(
+                *(self._extract_content_bounded(url, client, semaphore) for url in urls)
+            )
+
+        return [content for content in contents if content]
+
+    async def _extract_content_bounded(
+        self, url: str, client: httpx.AsyncClient, semaphore: asyncio.Semaphore
+    ) -> DocumentContent | None:
+        """Extract content from a URL under the fetch concurrency limit.
+
+        Args:
+            url: URL to extract from
+            client: Shared HTTP client
+            semaphore: Semaphore bounding concurrent fetches
+
+        Returns:
+            Extracted document content, or None on failure
+        """
+        async with semaphore:
+            content = await self._extract_content_from_url(url, client)
 
-        for url in urls:
-            try:
-                # Try regular extraction first
-                content = await self.content_extractor.extract_from_url(url)
+            # Rate limiting: each fetch slot pauses before it is reused
+            await asyncio.sleep(self.settings.rate_limit_delay)
 
-                if not content:
-                    continue
+        return content
 
-                # Check if it's a SPA and needs JavaScript rendering
-                if self.content_extractor.detect_spa(content.text):
-                    logger.info(f"SPA detected at {url}, using JavaScript renderer")
-                    html = await self.js_renderer.render_page(url)
-                    content = self.content_extractor.extract_from_html(url, html)
+    async def _extract_content_from_url(
+        self, url: str, client: httpx.AsyncClient | None = None
+    ) -> DocumentContent | None:
+        """Extract content from a single URL, rendering JavaScript for SPAs.
 
-                contents.append(content)
+        Args:
+            url: URL to extract from
+            client: Shared HTTP client to fetch with
 
-                # Rate limiting
-                await asyncio.sleep(self.settings.rate_limit_delay)
+        Returns:
+            Extracted document content, or None on failure
+        """
+        try:
+            # Try regular extraction first
+            content = await self.content_extractor.extract_from_url(url, client)
 
-            except Exception as e:
-                logger.error(f"Failed to extract content from {url}: {e}")
-                continue
+            if not content:
+                return None
+
+            # Check if it's a SPA and needs JavaScript rendering
+            if self.content_extractor.detect_spa(content.text):
+                logger.info(f"SPA detected at {url}, using JavaScript renderer")
+                html = await self.js_renderer.render_page(url)
+                content = self.content_extractor.extract_from_html(url, html)
 
-        return contents
+            return content
+
+        except Exception as e:
+            logger.error(f"Failed to extract content from {url}: {e}")
+            return None
+
+    async def _extract_pipelined(self, urls: list[str]) -> list[ExtractionResult]:
+        """Fetch pages and extract API information concurrently.
+
+        A producer fetches pages into a bounded queue while LLM workers drain it,
+        so LLM calls start as soon as the first page arrives instead of after the
+        whole site has been fetched. With use_batch_api, all pages are fetched first
+        and submitted as a single message batch instead.
+
+        Args:
+            urls: List of URLs to process
+
+        Returns:
+            List of extraction results with endpoints, in URL order
+        """
+        if self.settings.use_batch_api:
+            return await self._extract_with_batch_api(urls)
+
+        max_concurrent = self.settings.max_concurrent_llm_calls
+        batch_size = max(1, self.settings.llm_batch_size)
+        queue: asyncio.Queue[tuple[int, DocumentContent] | None] = asyncio.Queue(
+            maxsize=PIPELINE_QUEUE_SIZE
+        )
+        fetched: list[tuple[int, DocumentContent]] = []
+        indexed_results: list[tuple[int, ExtractionResult]] = []
+
+        async def produce() -> None:
+            """Fetch pages concurrently and hand each one to the LLM workers as it lands."""
+            max_fetches = self.settings.max_concurrent_requests
+            semaphore = asyncio.Semaphore(max_fetches)
+
+            async def fetch(index: int, url: str) -> None:
+                content = await self._extract_content_bounded(url, client, semaphore)
+                if content:
+                    fetched.append((index, content))
+                    await queue.put((index, content))
+
+            # The fetch task group is exited first, so no fetch (even a cancelled one)
+            # can outlive the client and browser it uses
+            async with (
+                self.content_extractor.create_client(max_fetches) as client,
+                self.js_renderer,
+                asyncio.TaskGroup() as fetch_group,
+            ):
+                for index, url in enumerate(urls):
+                    fetch_group.create_task(fetch(index, url))
+
+            # Only reached on success: if either side fails, the task group cancels the
+            # other, so no put() is left waiting on a queue nobody drains
+            for _ in range(max_concurrent):
+                await queue.put(None)
+
+        async def consume() -> None:
+            """Extract whatever pages are queued, up to one batch per LLM request."""
+            carry: tuple[int, DocumentContent] | None = None
+            done = False
+
+            while not done or carry:
+                item = carry or await queue.get()
+                carry = None
+                if item is None:
+                    break
+
+                batch = [item]
+                tokens = self._batch_tokens(item[1])
+                while len(batch) < batch_size and not queue.empty():
+                    next_item = queue.get_nowait()
+                    if next_item is None:
+                        done = True
+                        break
+                    next_tokens = self._batch_tokens(next_item[1])
+                    if tokens + next_tokens > MAX_BATCH_TOKENS:
+                        carry = next_item
+                        break
+                    batch.append(next_item)
+                    tokens += next_tokens
+
+                logger.info(f"Processing {len(batch)} page(s) from document {batch[0][0] + 1}")
+                results = await self._extract_batch([content for _, content in batch])
+                indexed_results.extend(
+                    (index, result) for (index, _), result in zip(batch, results, strict=True)
+                )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(produce())
+                for _ in range(max_concurrent):
+                    task_group.create_task(consume())
+        except ExceptionGroup as group:
+            # Surface the first failure itself rather than the group wrapping it
+            raise group.exceptions[0] from group
+
+        fetched.sort(key=lambda item: item[0])
+        self.extracted_content = [content for _, content in fetched]
+        indexed_results.sort(key=lambda item: item[0])
+        valid_results = [result for _, result in indexed_results if result.endpoints]
+        logger.info(
+            f"Pipelined extraction complete: {len(valid_results)}/{len(indexed_results)} "
+            f"documents successful"
+        )
+
+        return valid_results
+
+    async def _extract_with_batch_api(self, urls: list[str]) -> list[ExtractionResult]:
+        """Fetch every page, then extract them all in one Message Batches API job.
+
+        Args:
+            urls: List of URLs to process
+
+        Returns:
+            List of extraction results with endpoints, in URL order
+        """
+        self.extracted_content = await self._extract_content_from_urls(urls)
+        if not self.extracted_content:
+            return []
+
+        results = await self.llm_extractor.extract_batch(self.extracted_content)
+
+        valid_results = [result for result in results if result.endpoints]
+        logger.info(
+            f"Batch API extraction complete: {len(valid_results)}/{len(results)} "
+            f"documents successful"
+        )
+
+        return valid_results
 
     async def _extract_with_llm(self, contents: list[DocumentContent]) -> list[ExtractionResult]:
         """Extract API information using LLM (map-reduce pattern with parallel processing).
@@ -119,8 +313,12 @@ class OpenAPIOrchestrator:
         """
         logger.info(f"Starting parallel LLM extraction for {len(contents)} documents")
 
+        batch_size = self.settings.llm_batch_size
+        if batch_size > 1 and len(contents) > 1:
+            return await self._extract_with_llm_batched(contents, batch_size)
+
         # Map phase: Process documents in parallel with concurrency control
-        max_concurrent = getattr(self.settings, "max_concurrent_llm_calls", 3)
+        max_concurrent = self.settings.max_concurrent_llm_calls
 
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_concurrent)
@@ -155,3 +353,111 @@ class OpenAPIOrchestrator:
 
         # Reduce phase is handled in the generator (merging all results)
         return valid_results
+
+    async def _extract_with_llm_batched(
+        self, contents: list[DocumentContent], batch_size: int
+    ) -> list[ExtractionResult]:
+        """Extract API information packing several pages into each LLM request.
+
+        Args:
+            contents: List of document contents
+            batch_size: Maximum pages per LLM request
+
+        Returns:
+            List of extraction results
+        """
+        batches = self._plan_llm_batches(contents, batch_size)
+        logger.info(f"Packed {len(contents)} documents into {len(batches)} LLM requests")
+
+        max_concurrent = self.settings.max_concurrent_llm_calls
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def extract_batch(batch: list[DocumentContent], index: int) -> list[ExtractionResult]:
+            """Extract one batch with concurrency control."""
+            async with semaphore:
+                logger.info(f"Processing batch {index + 1}/{len(batches)} ({len(batch)} pages)")
+                return await self._extract_batch(batch)
+
+        batch_results = await asyncio.gather(
+            *(extract_batch(batch, i) for i, batch in enumerate(batches))
+        )
+
+        results = [result for batch_result in batch_results for result in batch_result]
+
+        valid_results = [r for r in results if r.endpoints]
+        logger.info(
+            f"Batched extraction complete: {len(valid_results)}/{len(contents)} "
+            f"documents successful"
+        )
+
+        return valid_results
+
+    async def _extract_batch(self, batch: list[DocumentContent]) -> list[ExtractionResult]:
+        """Extract one batch of pages, falling back to per-page requests on failure.
+
+        Args:
+            batch: Document contents to extract together
+
+        Returns:
+            Extraction results, one per content
+        """
+        if len(batch) > 1:
+            try:
+                return await self.llm_extractor.extract_many(batch)
+            except Exception as e:
+                logger.warning(
+                    f"Batched extraction failed ({e}), retrying {len(batch)} pages individually"
+                )
+
+        results = []
+        for content in batch:
+            try:
+                results.append(await self.llm_extractor.extract(content))
+            except Exception as e:
+                logger.error(f"LLM extraction failed for {content.url}: {e}")
+                results.append(ExtractionResult(confidence=ConfidenceLevel.LOW))
+        return results
+
+    @staticmethod
+    def _batch_tokens(content: DocumentContent) -> int:
+        """Estimate a page's share of a multi-page request's token budget.
+
+        Args:
+            content: Document content
+
+        Returns:
+            Conservative token estimate for the page
+        """
+        return content.char_count // BATCH_CHARS_PER_TOKEN
+
+    def _plan_llm_batches(
+        self, contents: list[DocumentContent], batch_size: int
+    ) -> list[list[DocumentContent]]:
+        """Group pages into LLM batches bounded by page count and token budget.
+
+        Args:
+            contents: List of document contents
+            batch_size: Maximum pages per batch
+
+        Returns:
+            List of batches, preserving document order
+        """
+        batches: list[list[DocumentContent]] = []
+        current: list[DocumentContent] = []
+        current_tokens = 0
+
+        for content in contents:
+            tokens = self._batch_tokens(content)
+            if current and (
+                len(current) >= batch_size or current_tokens + tokens > MAX_BATCH_TOKENS
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+
+            current.append(content)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
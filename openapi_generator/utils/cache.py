@@ -1,16 +1,22 @@
 """Caching utilities for HTTP responses and LLM results."""
 
-import hashlib
+import json
+import os
 import pickle
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from openapi_generator.config import get_settings
+from openapi_generator.utils.hashing import hexdigest
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# LLM results kept in memory in front of the pickle files
+LLM_MEMORY_CACHE_SIZE = 4096
+
 
 class CacheManager:
     """Manages caching for HTTP responses and LLM results."""
@@ -24,9 +30,14 @@ class CacheManager:
         # Create cache directories
         self.http_cache_dir = self.cache_dir / "http"
         self.llm_cache_dir = self.cache_dir / "llm"
+        self.discovery_cache_dir = self.cache_dir / "discovery"
+
+        # content_hash -> (time cached, result); results are shared, so treat as read-only
+        self._llm_memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 
         if self.settings.enable_http_cache:
             self.http_cache_dir.mkdir(parents=True, exist_ok=True)
+            self.discovery_cache_dir.mkdir(parents=True, exist_ok=True)
         if self.settings.enable_llm_cache:
             self.llm_cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -37,9 +48,9 @@ class CacheManager:
             data: Data to generate key for
 
         Returns:
-            MD5 hash of data
+            BLAKE2b hex digest of data
         """
-        return hashlib.md5(data.encode()).hexdigest()
+        return hexdigest(data)
 
     def _is_cache_valid(self, cache_file: Path) -> bool:
         """Check if cache file is still valid.
@@ -61,11 +72,12 @@ class CacheManager:
 
         return True
 
-    def get_http_cache(self, url: str) -> str | None:
+    def get_http_cache(self, url: str, allow_stale: bool = False) -> str | None:
         """Get cached HTTP response.
 
         Args:
             url: URL to get cache for
+            allow_stale: Return the body even if it is past its TTL (for revalidation)
 
         Returns:
             Cached response content or None
@@ -76,18 +88,45 @@ class CacheManager:
         cache_key = self._get_cache_key(url)
         cache_file = self.http_cache_dir / f"{cache_key}.txt"
 
-        if self._is_cache_valid(cache_file):
+        if self._is_cache_valid(cache_file) or (allow_stale and cache_file.exists()):
             logger.debug(f"HTTP cache hit: {url}")
             return cache_file.read_text(encoding="utf-8")
 
         return None
 
-    def set_http_cache(self, url: str, content: str) -> None:
+    def get_http_metadata(self, url: str) -> dict[str, str] | None:
+        """Get stored response headers (validators, content type) for a cached URL.
+
+        Metadata is returned regardless of age so stale entries can be revalidated.
+
+        Args:
+            url: URL to get metadata for
+
+        Returns:
+            Dictionary of stored headers or None
+        """
+        if not self.settings.enable_http_cache:
+            return None
+
+        cache_key = self._get_cache_key(url)
+        meta_file = self.http_cache_dir / f"{cache_key}.meta.json"
+
+        if not meta_file.exists():
+            return None
+
+        try:
+            return json.loads(meta_file.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Failed to load HTTP cache metadata: {e}")
+            return None
+
+    def set_http_cache(self, url: str, content: str, headers: dict[str, str] | None = None) -> None:
         """Cache HTTP response.
 
         Args:
             url: URL to cache
             content: Response content to cache
+            headers: Response headers to keep for revalidation (e.g. etag, last-modified)
         """
         if not self.settings.enable_http_cache:
             return
@@ -96,8 +135,62 @@ class CacheManager:
         cache_file = self.http_cache_dir / f"{cache_key}.txt"
 
         cache_file.write_text(content, encoding="utf-8")
+        if headers is not None:
+            meta_file = self.http_cache_dir / f"{cache_key}.meta.json"
+            meta_file.write_text(json.dumps(headers), encoding="utf-8")
         logger.debug(f"HTTP cache set: {url}")
 
+    def touch_http_cache(self, url: str) -> None:
+        """Restart the TTL of a cached response after successful revalidation.
+
+        Args:
+            url: Cached URL
+        """
+        if not self.settings.enable_http_cache:
+            return
+
+        cache_file = self.http_cache_dir / f"{self._get_cache_key(url)}.txt"
+        if cache_file.exists():
+            os.utime(cache_file)
+
+    def get_discovery_cache(self, key: str) -> list[str] | None:
+        """Get cached documentation URLs from a previous discovery run.
+
+        Args:
+            key: Discovery key (base URL and crawl limits)
+
+        Returns:
+            Cached list of documentation URLs or None
+        """
+        if not self.settings.enable_http_cache:
+            return None
+
+        cache_file = self.discovery_cache_dir / f"{self._get_cache_key(key)}.json"
+
+        if self._is_cache_valid(cache_file):
+            logger.debug(f"Discovery cache hit: {key}")
+            try:
+                return json.loads(cache_file.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.warning(f"Failed to load discovery cache: {e}")
+
+        return None
+
+    def set_discovery_cache(self, key: str, urls: list[str]) -> None:
+        """Cache documentation URLs found by discovery.
+
+        Args:
+            key: Discovery key (base URL and crawl limits)
+            urls: Discovered documentation URLs
+        """
+        if not self.settings.enable_http_cache:
+            return
+
+        self.discovery_cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self.discovery_cache_dir / f"{self._get_cache_key(key)}.json"
+        cache_file.write_text(json.dumps(urls), encoding="utf-8")
+        logger.debug(f"Discovery cache set: {key}")
+
     def get_llm_cache(self, content_hash: str) -> Any | None:
         """Get cached LLM extraction result.
 
@@ -110,19 +203,44 @@ class CacheManager:
         if not self.settings.enable_llm_cache:
             return None
 
+        entry = self._llm_memory.get(content_hash)
+        if entry is not None:
+            cached_at, result = entry
+            if time.time() - cached_at <= self.ttl:
+                self._llm_memory.move_to_end(content_hash)
+                logger.debug(f"LLM memory cache hit: {content_hash[:8]}")
+                return result
+            del self._llm_memory[content_hash]
+
         cache_file = self.llm_cache_dir / f"{content_hash}.pkl"
 
         if self._is_cache_valid(cache_file):
             logger.debug(f"LLM cache hit: {content_hash[:8]}")
             try:
                 with open(cache_file, "rb") as f:
-                    return pickle.load(f)
+                    result = pickle.load(f)
             except Exception as e:
                 logger.warning(f"Failed to load LLM cache: {e}")
                 return None
 
+            self._remember_llm_result(content_hash, cache_file.stat().st_mtime, result)
+            return result
+
         return None
 
+    def _remember_llm_result(self, content_hash: str, cached_at: float, result: Any) -> None:
+        """Keep an LLM result in the in-memory tier, evicting the least recently used.
+
+        Args:
+            content_hash: Hash of content that was extracted
+            cached_at: Time the result was cached (for TTL checks)
+            result: ExtractionResult to keep
+        """
+        self._llm_memory[content_hash] = (cached_at, result)
+        self._llm_memory.move_to_end(content_hash)
+        if len(self._llm_memory) > LLM_MEMORY_CACHE_SIZE:
+            self._llm_memory.popitem(last=False)
+
     def set_llm_cache(self, content_hash: str, result: Any) -> None:
         """Cache LLM extraction result.
 
@@ -133,6 +251,8 @@ class CacheManager:
         if not self.settings.enable_llm_cache:
             return
 
+        self._remember_llm_result(content_hash, time.time(), result)
+
         cache_file = self.llm_cache_dir / f"{content_hash}.pkl"
 
         try:
@@ -149,7 +269,7 @@ class CacheManager:
             content: Content to hash
 
         Returns:
-            MD5 hash of content
+            BLAKE2b hex digest of content
         """
         return self._get_cache_key(content)
 
@@ -168,6 +288,10 @@ class CacheManager:
             for cache_file in self.http_cache_dir.glob("*.txt"):
                 cache_file.unlink()
                 deleted += 1
+            for meta_file in self.http_cache_dir.glob("*.meta.json"):
+                meta_file.unlink()
+            for cache_file in self.discovery_cache_dir.glob("*.json"):
+                cache_file.unlink()
             logger.info(f"Cleared {deleted} HTTP cache files")
 
         if cache_type in (None, "llm"):
@@ -176,6 +300,7 @@ class CacheManager:
                 cache_file.unlink()
                 llm_deleted += 1
             deleted += llm_deleted
+            self._llm_memory.clear()
             logger.info(f"Cleared {llm_deleted} LLM cache files")
 
         return deleted
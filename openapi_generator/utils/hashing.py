@@ -0,0 +1,34 @@
+"""Fast content hashing for cache keys."""
+
+import hashlib
+
+# 128-bit digests: collision-safe for cache keys, 32 hex characters like MD5
+_DIGEST_SIZE = 16
+
+
+def digest(data: str | bytes) -> bytes:
+    """Hash text or bytes with BLAKE2b.
+
+    Args:
+        data: Data to hash (str is encoded as UTF-8)
+
+    Returns:
+        16-byte digest
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+
+
+def hexdigest(data: str | bytes) -> str:
+    """Hash text or bytes with BLAKE2b, for use in file names.
+
+    Args:
+        data: Data to hash (str is encoded as UTF-8)
+
+    Returns:
+        32-character hex digest
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).hexdigest()
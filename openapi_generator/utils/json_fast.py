@@ -0,0 +1,37 @@
+"""Fast JSON parsing and serialization backed by orjson."""
+
+from typing import Any
+
+import orjson
+
+# Specs loaded from YAML can carry non-string keys (e.g. status code 200)
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    return orjson.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    option = _DUMPS_OPTIONS | orjson.OPT_INDENT_2 if indent else _DUMPS_OPTIONS
+    return orjson.dumps(obj, option=option)
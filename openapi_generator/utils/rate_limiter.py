@@ -0,0 +1,53 @@
+"""Async token-bucket rate limiter for outbound API calls."""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter allowing ``max_rate`` acquisitions per ``time_period`` seconds.
+
+    The bucket starts full, so short bursts up to ``max_rate`` go through immediately
+    and sustained load is smoothed to the configured rate.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """Initialize rate limiter.
+
+        Args:
+            max_rate: Maximum acquisitions per time period
+            time_period: Length of the time period in seconds
+        """
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_rate, self._tokens + (now - self._last_refill) * self._rate_per_sec
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate_per_sec)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -69,6 +69,21 @@ class RobotsChecker:
             logger.warning(f"Error getting crawl delay: {e}")
             return None
 
+    def get_sitemaps(self) -> list[str]:
+        """Get sitemap URLs listed in robots.txt.
+
+        Returns:
+            Sitemap URLs from ``Sitemap:`` lines, or an empty list
+        """
+        if not self.loaded:
+            return []
+
+        try:
+            return self.parser.site_maps() or []
+        except Exception as e:
+            logger.warning(f"Error reading sitemaps: {e}")
+            return []
+
     def is_sitemaps_allowed(self) -> bool:
         """Check if sitemaps are mentioned in robots.txt.
 
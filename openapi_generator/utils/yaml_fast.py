@@ -0,0 +1,42 @@
+"""YAML parsing and serialization using libyaml when available."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes | IO[str]) -> Any:
+    """Parse a YAML document.
+
+    Args:
+        stream: YAML text or file object
+
+    Returns:
+        Parsed Python object
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream: IO[str] | None = None) -> str | None:
+    """Serialize data to block-style YAML, preserving key order.
+
+    Args:
+        data: Data to serialize
+        stream: Optional file object to write to
+
+    Returns:
+        YAML string, or None when written to a stream
+    """
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
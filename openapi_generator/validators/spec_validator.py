@@ -1,12 +1,62 @@
 """OpenAPI specification validator."""
 
-from openapi_spec_validator import validate
+from functools import lru_cache
+
+from openapi_spec_validator.schemas import get_validator_backend
+from openapi_spec_validator.shortcuts import get_validator_cls
 from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 
 from openapi_generator.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Operations checked for missing descriptions/examples
+_RECOMMENDATION_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+
+
+@lru_cache(maxsize=8)
+def _get_validator_cls(version_key: str, version: str) -> type:
+    """Resolve the spec validator class for a version, compiling its meta-schema once.
+
+    Args:
+        version_key: "openapi" or "swagger"
+        version: Version string from the spec
+
+    Returns:
+        Spec validator class
+    """
+    validator_cls = get_validator_cls({version_key: version})
+    # Force the lazily loaded meta-schema validator to compile now, not mid-request
+    validator_cls.schema_validator.iter_errors
+    return validator_cls
+
+
+def warm_up(openapi_version: str = "3.0.3") -> None:
+    """Compile the meta-schema validator ahead of the first validation.
+
+    Args:
+        openapi_version: OpenAPI version to prepare a validator for
+    """
+    _get_validator_cls("openapi", openapi_version)
+
+
+def _resolve_validator_cls(spec_dict: dict) -> type:
+    """Get the cached spec validator class for a specification.
+
+    Args:
+        spec_dict: OpenAPI specification as dictionary
+
+    Returns:
+        Spec validator class
+    """
+    for version_key in ("openapi", "swagger"):
+        version = spec_dict.get(version_key)
+        if isinstance(version, str):
+            return _get_validator_cls(version_key, version)
+
+    # Let the library raise its usual detection error
+    return get_validator_cls(spec_dict)
+
 
 class SpecValidator:
     """Validates OpenAPI specifications."""
@@ -21,24 +71,25 @@ class SpecValidator:
             Tuple of (is_valid, error_messages)
         """
         logger.info("Validating OpenAPI specification...")
+        logger.debug(f"Schema validator backend: {get_validator_backend()}")
 
         errors = []
 
         try:
-            # Validate against OpenAPI schema
-            validate(spec_dict)
-            logger.info(" Specification is valid!")
-            return True, []
+            # Validate against OpenAPI schema, collecting every error in one pass
+            validator_cls = _resolve_validator_cls(spec_dict)
+            errors = [str(error) for error in validator_cls(spec_dict).iter_errors()]
+
+            if not errors:
+                logger.info(" Specification is valid!")
+                return True, []
+
+            logger.error(f" Validation failed: {errors[0]}")
+            return False, errors
 
         except OpenAPIValidationError as e:
             logger.error(f" Validation failed: {e}")
             errors.append(str(e))
-
-            # Try to extract more detailed errors
-            if hasattr(e, "schema_errors"):
-                for error in e.schema_errors:
-                    errors.append(f"  - {error}")
-
             return False, errors
 
         except Exception as e:
@@ -70,7 +121,7 @@ class SpecValidator:
 
             for path, methods in paths.items():
                 for method, operation in methods.items():
-                    if method in ["get", "post", "put", "delete", "patch"]:
+                    if method in _RECOMMENDATION_METHODS:
                         total_operations += 1
 
                         if not operation.get("description"):
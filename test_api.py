@@ -71,7 +71,7 @@ async def test_api(api_name: str, api_info: dict) -> dict:
 
         # Discovery
         console.print("→ Discovering documentation...")
-        doc_urls = await orchestrator.discovery.discover()
+        doc_urls = await orchestrator.discover()
 
         if not doc_urls:
             return {
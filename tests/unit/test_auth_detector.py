@@ -188,3 +188,28 @@ def test_multiple_auth_types():
     assert "apiKey" in types
     assert "http" in types
     assert "oauth2" in types
+
+
+def test_detect_auth_schemes_cached():
+    """Test that repeated documents are served from the cache."""
+    detector = AuthDetector(cache_size=1)
+
+    text = "Use Authorization: Bearer <token> on every request."
+
+    first = detector.detect_auth_schemes(text)
+    first.clear()
+    second = detector.detect_auth_schemes(text)
+
+    # Callers get a copy, so mutating one result does not affect the cache
+    assert len(second) == 1
+    assert second[0].scheme == "bearer"
+
+    detector.detect_auth_schemes("No authentication required.")
+    assert len(detector._cache) == 1
+
+
+def test_no_auth_keywords():
+    """Test that pages without any auth keywords detect nothing."""
+    detector = AuthDetector()
+
+    assert detector.detect_auth_schemes("Returns a list of users, sorted by name.") == []
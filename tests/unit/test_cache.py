@@ -48,7 +48,7 @@ def test_cache_key_generation(cache_manager):
 
     assert key1 == key2
     assert key1 != key3
-    assert len(key1) == 32  # MD5 hash length
+    assert len(key1) == 32  # 128-bit hex digest
 
 
 def test_http_cache_set_get(cache_manager):
@@ -140,3 +140,40 @@ def test_clear_cache(cache_manager):
     cache_manager.set_http_cache("https://test2.com", "content2")
     deleted = cache_manager.clear_cache()
     assert deleted >= 2
+
+
+def test_http_cache_metadata_and_stale(cache_manager):
+    """Test that validators are kept and stale bodies remain available for revalidation."""
+    url = "https://example.com/docs"
+    cache_manager.set_http_cache(url, "<html>docs</html>", headers={"etag": '"v1"'})
+
+    assert cache_manager.get_http_metadata(url) == {"etag": '"v1"'}
+
+    cache_manager.ttl = -1
+    assert cache_manager.get_http_cache(url) is None
+    assert cache_manager.get_http_cache(url, allow_stale=True) == "<html>docs</html>"
+
+
+def test_discovery_cache_set_get(cache_manager):
+    """Test discovery cache set, get and clear."""
+    urls = ["https://example.com/docs", "https://example.com/api"]
+
+    cache_manager.set_discovery_cache("https://example.com|pages=50", urls)
+
+    assert cache_manager.get_discovery_cache("https://example.com|pages=50") == urls
+    assert cache_manager.get_discovery_cache("https://example.com|pages=10") is None
+
+    cache_manager.clear_cache("http")
+    assert cache_manager.get_discovery_cache("https://example.com|pages=50") is None
+
+
+def test_llm_cache_memory_tier(cache_manager):
+    """Test that LLM results are served from memory without reading the file."""
+    result = ExtractionResult(confidence=ConfidenceLevel.HIGH)
+    cache_manager.set_llm_cache("memory_hash", result)
+
+    (cache_manager.llm_cache_dir / "memory_hash.pkl").unlink()
+    assert cache_manager.get_llm_cache("memory_hash") is result
+
+    cache_manager.clear_cache("llm")
+    assert cache_manager.get_llm_cache("memory_hash") is None
@@ -0,0 +1,69 @@
+"""Unit tests for content extraction."""
+
+import httpx
+import pytest
+
+from openapi_generator.extractors.content import ContentExtractor, DocumentContent
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """Create a content extractor with a small page limit and no disk cache."""
+
+    class MockSettings:
+        max_page_bytes = 1000
+        max_concurrent_requests = 2
+        request_timeout = 5
+
+    class MockCacheManager:
+        def set_http_cache(self, url, body, headers=None):
+            pass
+
+    monkeypatch.setattr("openapi_generator.extractors.content.get_settings", lambda: MockSettings())
+    monkeypatch.setattr(
+        "openapi_generator.extractors.content.get_cache_manager", lambda: MockCacheManager()
+    )
+    return ContentExtractor(use_cache=False)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve a docs page, a PDF, an oversized page and a chunked oversized page."""
+    path = request.url.path
+    if path == "/docs":
+        return httpx.Response(
+            200,
+            text="<html><body><h1>Users API</h1><p>List all users.</p></body></html>",
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+    if path == "/guide.pdf":
+        return httpx.Response(200, content=b"%PDF-1.7", headers={"content-type": "application/pdf"})
+    if path == "/large":
+        return httpx.Response(200, text="x" * 5000, headers={"content-type": "text/html"})
+    # No Content-Length header
+    return httpx.Response(
+        200, content=iter([b"y" * 800, b"y" * 800]), headers={"content-type": "text/html"}
+    )
+
+
+async def test_fetch_skips_non_document_and_oversized(extractor):
+    """Test that PDFs and pages over max_page_bytes are skipped before parsing."""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        content = await extractor.extract_from_url("https://api.example.com/docs", client)
+        assert content is not None
+        assert "List all users." in content.text
+
+        for path in ("/guide.pdf", "/large", "/chunked"):
+            url = f"https://api.example.com{path}"
+            assert await extractor.extract_from_url(url, client) is None
+
+
+def test_token_estimate():
+    """Test that the token estimate counts text and code samples."""
+    content = DocumentContent(
+        url="https://api.example.com/docs",
+        title="Docs",
+        text="a" * 40,
+        code_samples=["b" * 20, "c" * 20],
+    )
+
+    assert content.token_estimate == 20
@@ -0,0 +1,155 @@
+"""Unit tests for documentation discovery."""
+
+import httpx
+import pytest
+
+from openapi_generator.extractors.discovery import DocumentationDiscovery
+
+
+@pytest.fixture
+def robots_checker(monkeypatch):
+    """Replace RobotsChecker with a stub; tests set its sitemaps and crawl delay."""
+
+    class MockRobotsChecker:
+        sitemaps: list[str] = []
+        crawl_delay: float | None = None
+
+        def __init__(self, base_url):
+            pass
+
+        def get_sitemaps(self):
+            return self.sitemaps
+
+        def get_crawl_delay(self, user_agent="*"):
+            return self.crawl_delay
+
+    monkeypatch.setattr("openapi_generator.extractors.discovery.RobotsChecker", MockRobotsChecker)
+    return MockRobotsChecker
+
+
+def _transport(requests: list[tuple[str, str]]) -> httpx.MockTransport:
+    """Build a mock transport serving a docs page, a HEAD-less spec and a 404."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        path = request.url.path
+
+        if path == "/docs":
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={"content-type": "text/html"})
+            return httpx.Response(
+                200,
+                text="<html>API endpoint reference: GET /users, POST /users</html>",
+                headers={"content-type": "text/html"},
+            )
+        if path == "/api-docs":
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(200, json={"openapi": "3.0.0"})
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
+async def test_check_url_probes_with_head(monkeypatch):
+    """Test that missing paths are rejected by HEAD without a GET."""
+    # Avoid fetching robots.txt over the network
+    monkeypatch.setattr(
+        "openapi_generator.extractors.discovery.RobotsChecker", lambda base_url: None
+    )
+    requests: list[tuple[str, str]] = []
+    discovery = DocumentationDiscovery("https://api.example.com")
+
+    async with httpx.AsyncClient(transport=_transport(requests)) as client:
+        assert await discovery._check_url(client, "https://api.example.com/docs")
+        assert await discovery._check_url(client, "https://api.example.com/api-docs")
+        assert await discovery._check_url(client, "https://api.example.com/missing") is None
+
+    assert ("GET", "/missing") not in requests
+    # HEAD not allowed falls back to GET
+    assert ("GET", "/api-docs") in requests
+
+
+def test_normalize_url():
+    """Test that equivalent URL spellings normalize to the same key."""
+    normalize = DocumentationDiscovery._normalize_url
+
+    assert normalize("https://API.example.com/docs/#auth") == "https://api.example.com/docs"
+    assert normalize("https://api.example.com/docs?v=2#x") == "https://api.example.com/docs?v=2"
+    assert normalize("https://api.example.com") == "https://api.example.com/"
+
+
+async def test_sitemap_index_is_followed(monkeypatch):
+    """Test that sitemap indexes are followed and doc URLs collected from children."""
+    monkeypatch.setattr(
+        "openapi_generator.extractors.discovery.RobotsChecker", lambda base_url: None
+    )
+    index = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-docs.xml</loc></sitemap>
+</sitemapindex>"""
+    child = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc> https://example.com/api/reference </loc></url>
+  <url><loc>https://example.com/blog/launch</loc></url>
+</urlset>"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/sitemap-docs.xml":
+            return httpx.Response(200, content=child)
+        return httpx.Response(200, content=index)
+
+    discovery = DocumentationDiscovery("https://example.com")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await discovery._extract_urls_from_sitemap(client, index)
+
+    assert discovery.doc_urls == {"https://example.com/api/reference"}
+
+
+async def test_parse_sitemap_uses_robots_sitemaps(robots_checker):
+    """Test that sitemaps listed in robots.txt are tried alongside the defaults."""
+    robots_checker.sitemaps = ["https://example.com/custom-sitemap.xml"]
+    sitemap = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/docs/users</loc></url>
+</urlset>"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/custom-sitemap.xml":
+            return httpx.Response(200, content=sitemap)
+        return httpx.Response(404)
+
+    discovery = DocumentationDiscovery("https://example.com")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await discovery._parse_sitemap(client)
+
+    assert discovery.doc_urls == {"https://example.com/docs/users"}
+
+
+async def test_crawl_page_prioritizes_doc_links(monkeypatch, robots_checker):
+    """Test that links that look like documentation are returned separately."""
+    links = "".join(f'<a href="/blog/{i}">post</a>' for i in range(20))
+    html = (
+        f'<html>{links}<a href="/docs/users">Users</a>'
+        '<a href="https://other.com/docs">Other</a></html>'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=html, headers={"content-type": "text/html"})
+
+    discovery = DocumentationDiscovery("https://example.com")
+    monkeypatch.setattr(discovery.settings, "rate_limit_delay", 0)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        doc_links, other_links = await discovery._crawl_page(client, "https://example.com/")
+
+    assert doc_links == ["https://example.com/docs/users"]
+    assert len(other_links) == 9
+
+
+def test_host_limiter_respects_crawl_delay(robots_checker):
+    """Test that a robots.txt crawl delay limits each host to one request per delay."""
+    robots_checker.crawl_delay = 2.0
+    discovery = DocumentationDiscovery("https://example.com")
+
+    limiter = discovery._host_limiter("https://example.com/docs")
+    assert (limiter.max_rate, limiter.time_period) == (1, 2.0)
+    assert discovery._host_limiter("https://example.com/guides") is limiter
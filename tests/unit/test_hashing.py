@@ -0,0 +1,16 @@
+"""Unit tests for content hashing."""
+
+from openapi_generator.utils.hashing import digest, hexdigest
+
+
+def test_hexdigest_stable_and_distinct():
+    """Test that equal inputs hash equally and different inputs differ."""
+    assert hexdigest("test content") == hexdigest("test content")
+    assert hexdigest("test content") != hexdigest("different content")
+    assert len(hexdigest("test content")) == 32
+
+
+def test_str_and_bytes_agree():
+    """Test that str input is hashed as its UTF-8 encoding."""
+    assert digest("café") == digest("café".encode())
+    assert digest("café").hex() == hexdigest("café")
@@ -0,0 +1,32 @@
+"""Unit tests for orjson-backed JSON helpers."""
+
+import json
+
+import pytest
+
+from openapi_generator.utils import json_fast
+
+
+def test_roundtrip():
+    """Test that dumps/loads round-trip a spec dict."""
+    spec = {"openapi": "3.0.3", "paths": {"/users": {"get": {"summary": "Lïst"}}}}
+
+    assert json_fast.loads(json_fast.dumps(spec)) == spec
+
+
+def test_indent_matches_stdlib():
+    """Test that indented output matches json.dumps(indent=2)."""
+    spec = {"info": {"title": "API", "version": "1.0"}, "paths": {}}
+
+    assert json_fast.dumps(spec, indent=True).decode() == json.dumps(spec, indent=2)
+
+
+def test_non_string_keys():
+    """Test that integer keys from YAML-loaded specs are serialized."""
+    assert json_fast.dumps({200: {"description": "OK"}}) == b'{"200":{"description":"OK"}}'
+
+
+def test_invalid_json_raises_stdlib_error():
+    """Test that parse errors remain catchable as json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        json_fast.loads("openapi: 3.0.3")
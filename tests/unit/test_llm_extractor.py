@@ -0,0 +1,87 @@
+"""Unit tests for LLM extraction."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from openapi_generator.extractors.content import DocumentContent
+from openapi_generator.extractors.llm_extractor import MAX_OUTPUT_TOKENS, LLMExtractor
+
+
+class MockStream:
+    """Async context manager standing in for a messages.stream() call."""
+
+    def __init__(self, message):
+        self.message = message
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+    async def get_final_message(self):
+        return self.message
+
+
+class MockMessages:
+    """Records the arguments of every streamed request."""
+
+    def __init__(self):
+        self.calls = []
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        usage = SimpleNamespace(
+            cache_read_input_tokens=0, cache_creation_input_tokens=0, input_tokens=0
+        )
+        return MockStream(SimpleNamespace(stop_reason="end_turn", content=[], usage=usage))
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """Create an LLM extractor with a stubbed client and no cache."""
+
+    class MockSettings:
+        anthropic_api_key = "test-key"
+        anthropic_model = "test-model"
+        llm_timeout = 5
+        llm_max_retries = 0
+        llm_requests_per_minute = 1000
+        max_pages_per_site = 10
+
+    class MockCacheManager:
+        def get_content_hash(self, text):
+            return str(hash(text))
+
+        def get_llm_cache(self, content_hash):
+            return None
+
+        def set_llm_cache(self, content_hash, result):
+            pass
+
+    monkeypatch.setattr(
+        "openapi_generator.extractors.llm_extractor.get_settings", lambda: MockSettings()
+    )
+    monkeypatch.setattr(
+        "openapi_generator.extractors.llm_extractor.get_cache_manager", lambda: MockCacheManager()
+    )
+    extractor = LLMExtractor(use_cache=False)
+    extractor.client = SimpleNamespace(messages=MockMessages())
+    return extractor
+
+
+async def test_multi_page_max_tokens_is_capped(extractor):
+    """Test that dense pages batched together never exceed the output token cap."""
+    dense_text = "\n".join(f"GET /resource{i}" for i in range(100))
+    contents = [
+        DocumentContent(f"https://api.example.com/page{page}", "Reference", dense_text, [])
+        for page in range(4)
+    ]
+
+    results = await extractor.extract_many(contents)
+
+    assert len(results) == 4
+    calls = extractor.client.messages.calls
+    assert len(calls) == 1
+    assert calls[0]["max_tokens"] == MAX_OUTPUT_TOKENS
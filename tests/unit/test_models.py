@@ -110,6 +110,13 @@ def test_endpoint_defaults():
     assert endpoint.confidence == ConfidenceLevel.MEDIUM
 
 
+def test_endpoint_path_gets_leading_slash():
+    """Test that endpoint paths are normalized to start with a slash."""
+    endpoint = Endpoint(path="users/{id}", method=HTTPMethod.GET)
+
+    assert endpoint.path == "/users/{id}"
+
+
 def test_coverage_report_calculations():
     """Test CoverageReport calculations."""
     report = CoverageReport(
@@ -149,13 +149,42 @@ def test_deduplication():
         )
     ]
 
-    builder.endpoints = endpoints1 + endpoints2
-    unique = builder._deduplicate_endpoints()
+    builder.add_extraction_results(
+        [ExtractionResult(endpoints=endpoints1), ExtractionResult(endpoints=endpoints2)]
+    )
+    spec = builder.build()
 
     # Should keep only one
-    assert len(unique) == 1
+    assert len(builder.endpoints) == 1
+    assert list(spec.paths["/users"]) == ["get"]
     # Should keep the higher confidence one
-    assert unique[0].summary == "List users - v2"
+    assert spec.paths["/users"]["get"]["summary"] == "List users - v2"
+
+
+def test_add_extraction_results_merges_duplicates():
+    """Test that duplicates are merged when results are added."""
+    builder = OpenAPIBuilder("https://api.example.com")
+
+    bare = Endpoint(path="/users", method=HTTPMethod.GET, summary="List users - bare")
+    detailed = Endpoint(
+        path="/users",
+        method=HTTPMethod.GET,
+        summary="List users - detailed",
+        parameters=[
+            Parameter(name="limit", location=ParameterLocation.QUERY, type=DataType.INTEGER)
+        ],
+    )
+    other = Endpoint(path="/users", method=HTTPMethod.POST, summary="Create user")
+
+    builder.add_extraction_results(
+        [
+            ExtractionResult(endpoints=[bare, other]),
+            ExtractionResult(endpoints=[detailed]),
+        ]
+    )
+
+    # Same confidence, so the endpoint with more detail wins and keeps its position
+    assert [e.summary for e in builder.endpoints] == ["List users - detailed", "Create user"]
 
 
 def test_operation_id_generation():
@@ -0,0 +1,96 @@
+"""Unit tests for the generation pipeline orchestrator."""
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+
+from openapi_generator.extractors.content import DocumentContent
+from openapi_generator.orchestrator import PIPELINE_QUEUE_SIZE, OpenAPIOrchestrator
+
+
+@pytest.fixture
+def orchestrator():
+    """Create an orchestrator whose fetch and render steps are stubbed out."""
+
+    @contextlib.asynccontextmanager
+    async def create_client(max_connections):
+        yield None
+
+    orchestrator = OpenAPIOrchestrator.__new__(OpenAPIOrchestrator)
+    orchestrator.settings = SimpleNamespace(
+        use_batch_api=False,
+        max_concurrent_llm_calls=2,
+        llm_batch_size=1,
+        max_concurrent_requests=5,
+    )
+    orchestrator.content_extractor = SimpleNamespace(create_client=create_client)
+    orchestrator.js_renderer = contextlib.nullcontext()
+
+    async def extract_content(url, client, semaphore):
+        return DocumentContent(url, "Reference", "GET /users", [])
+
+    orchestrator._extract_content_bounded = extract_content
+    return orchestrator
+
+
+def test_dense_pages_are_split_across_batches(orchestrator):
+    """Test that batches are budgeted conservatively enough to split code-heavy pages."""
+    # 25K tokens each at 4 chars per token, but up to twice that for dense code
+    contents = [
+        DocumentContent(f"https://api.example.com/page{i}", "Reference", "x" * 100_000, [])
+        for i in range(4)
+    ]
+
+    batches = orchestrator._plan_llm_batches(contents, batch_size=4)
+
+    assert [len(batch) for batch in batches] == [2, 2]
+
+
+async def test_pipeline_fails_instead_of_hanging_when_workers_fail(orchestrator):
+    """Test that an LLM worker failure stops the producer even with a full queue."""
+
+    async def extract_batch(batch):
+        raise RuntimeError("LLM unavailable")
+
+    orchestrator._extract_batch = extract_batch
+    urls = [f"https://api.example.com/page{i}" for i in range(PIPELINE_QUEUE_SIZE * 2)]
+
+    with pytest.raises(RuntimeError, match="LLM unavailable"):
+        await asyncio.wait_for(orchestrator._extract_pipelined(urls), timeout=5)
+
+
+async def test_fetches_do_not_outlive_the_client(orchestrator):
+    """Test that pending fetches are cancelled before the HTTP client closes."""
+    client_open = False
+    late_fetches: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def create_client(max_connections):
+        nonlocal client_open
+        client_open = True
+        try:
+            yield None
+        finally:
+            client_open = False
+
+    async def extract_content(url, client, semaphore):
+        await asyncio.sleep(0.005 * int(url.rsplit("page", 1)[1]))
+        if not client_open:
+            late_fetches.append(url)
+        return DocumentContent(url, "Reference", "GET /users", [])
+
+    async def extract_batch(batch):
+        raise RuntimeError("LLM unavailable")
+
+    orchestrator.content_extractor = SimpleNamespace(create_client=create_client)
+    orchestrator._extract_content_bounded = extract_content
+    orchestrator._extract_batch = extract_batch
+    urls = [f"https://api.example.com/page{i}" for i in range(20)]
+
+    with pytest.raises(RuntimeError, match="LLM unavailable"):
+        await asyncio.wait_for(orchestrator._extract_pipelined(urls), timeout=5)
+    await asyncio.sleep(0.15)
+
+    assert late_fetches == []
@@ -0,0 +1,38 @@
+"""Unit tests for async rate limiter."""
+
+import time
+
+import pytest
+
+from openapi_generator.utils.rate_limiter import AsyncRateLimiter
+
+
+async def test_burst_within_rate_is_immediate():
+    """Test that acquisitions up to max_rate do not wait."""
+    limiter = AsyncRateLimiter(5, 60.0)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.monotonic() - start < 0.1
+
+
+async def test_acquire_waits_when_bucket_empty():
+    """Test that exceeding the rate waits for a token to refill."""
+    limiter = AsyncRateLimiter(10, 1.0)
+
+    for _ in range(10):
+        await limiter.acquire()
+
+    start = time.monotonic()
+    async with limiter:
+        pass
+
+    assert time.monotonic() - start >= 0.05
+
+
+def test_invalid_rate():
+    """Test that non-positive rates are rejected."""
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(0)
@@ -0,0 +1,35 @@
+"""Unit tests for OpenAPI spec validator."""
+
+from openapi_generator.validators.spec_validator import SpecValidator, _get_validator_cls
+
+
+def _spec(**info):
+    return {"openapi": "3.0.3", "info": info, "paths": {}}
+
+
+def test_valid_spec():
+    """Test that a minimal valid spec passes."""
+    is_valid, errors = SpecValidator().validate(_spec(title="API", version="1.0"))
+
+    assert is_valid is True
+    assert errors == []
+
+
+def test_invalid_spec_reports_all_errors():
+    """Test that every schema error is collected."""
+    is_valid, errors = SpecValidator().validate(_spec())
+
+    assert is_valid is False
+    assert len(errors) == 2
+    assert any('"title"' in error for error in errors)
+    assert any('"version"' in error for error in errors)
+
+
+def test_validator_class_reused_across_instances():
+    """Test that the validator class is resolved once per OpenAPI version."""
+    SpecValidator().validate(_spec(title="API", version="1.0"))
+    hits = _get_validator_cls.cache_info().hits
+
+    SpecValidator().validate(_spec(title="API", version="1.0"))
+
+    assert _get_validator_cls.cache_info().hits == hits + 1
@@ -0,0 +1,21 @@
+"""Unit tests for libyaml-backed YAML helpers."""
+
+import yaml
+
+from openapi_generator.utils import yaml_fast
+
+
+def test_dump_matches_pyyaml_block_style():
+    """Test that output matches the previous yaml.dump settings."""
+    spec = {"openapi": "3.0.3", "info": {"title": "API", "version": "1.0"}, "tags": ["a", "b"]}
+
+    assert yaml_fast.dump(spec) == yaml.dump(spec, default_flow_style=False, sort_keys=False)
+
+
+def test_dump_to_stream(tmp_path):
+    """Test that dumping to a file object writes the document."""
+    path = tmp_path / "spec.yaml"
+    with open(path, "w") as f:
+        assert yaml_fast.dump({"paths": {}}, f) is None
+
+    assert yaml_fast.safe_load(path.read_text()) == {"paths": {}}